@@ -9,16 +9,47 @@ Incluye integración con CacheService para optimizar queries frecuentes.
 """
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session, joinedload, lazyload, selectinload
 
-from src.models import Summary, Transcription, Video
+from src.models import Source, Summary, TelegramUser, Transcription, Video
 from src.repositories.base_repository import BaseRepository
+from src.repositories.exceptions import NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# ==================== SENTENCIAS FULL-TEXT PRECONSTRUIDAS ====================
+# Se construyen una sola vez con bindparam(): cada llamada solo pasa valores,
+# así la sentencia compilada se reutiliza desde la caché de SQLAlchemy.
+
+# Vector de búsqueda concatenando summary_text, keywords (array_to_string) y category
+_FTS_VECTOR = func.to_tsvector(
+    "english",
+    func.coalesce(Summary.summary_text, "")
+    + " "
+    + func.coalesce(func.array_to_string(Summary.keywords, " "), "")
+    + " "
+    + func.coalesce(Summary.category, ""),
+)
+_FTS_QUERY = func.plainto_tsquery("english", bindparam("q"))
+_FTS_MATCH = _FTS_VECTOR.op("@@")(_FTS_QUERY)
+_FTS_RANK = func.ts_rank(_FTS_VECTOR, _FTS_QUERY).label("relevance_score")
+
+# Resultados ordenados por relevancia (primera página y páginas tras un cursor)
+_FTS_STMT = (
+    select(Summary, _FTS_RANK)
+    .where(_FTS_MATCH)
+    .order_by(_FTS_RANK.desc())
+    .limit(bindparam("limit"))
+)
+_FTS_AFTER_STMT = _FTS_STMT.where(_FTS_RANK < bindparam("cursor_rank"))
+
+# Rank del resumen usado como cursor (None si no existe o no coincide)
+_FTS_CURSOR_RANK_STMT = select(_FTS_RANK).where(Summary.id == bindparam("cursor")).where(_FTS_MATCH)
+
 
 class SummaryRepository(BaseRepository[Summary]):
     """
@@ -138,16 +169,58 @@ class SummaryRepository(BaseRepository[Summary]):
         """
         query = self.session.query(Summary)
 
-        # Eager loading de relaciones si se solicita
+        # Eager loading de relaciones si se solicita: un SELECT ... IN por
+        # nivel (no N+1); el resto de relaciones del resumen quedan lazy
         if with_relations:
             query = query.options(
-                joinedload(Summary.transcription)
-                .joinedload(Transcription.video)
-                .joinedload(Video.source)
+                selectinload(Summary.transcription)
+                .selectinload(Transcription.video)
+                .selectinload(Video.source),
+                lazyload("*"),
             )
 
         return query.order_by(Summary.created_at.desc()).limit(limit).all()
 
+    def get_for_distribution(self, summary_id: UUID) -> Summary | None:
+        """
+        Obtiene un resumen con todo lo necesario para distribuirlo por Telegram.
+
+        Carga en una sola consulta (JOIN) transcripción, video y source, más
+        un SELECT IN para los usuarios suscritos al source. No usa caché:
+        la distribución necesita la instancia persistente con sus relaciones.
+
+        Args:
+            summary_id: UUID del resumen
+
+        Returns:
+            Summary con relaciones cargadas, o None si no existe
+
+        Example:
+            summary = repo.get_for_distribution(summary_id)
+            source = summary.transcription.video.source
+            for user in source.users:
+                ...
+        """
+        transcription_path = joinedload(Summary.transcription)
+        video_path = transcription_path.joinedload(Transcription.video)
+        source_path = video_path.joinedload(Video.source)
+
+        return (
+            self.session.query(Summary)
+            .options(
+                # TelegramUser.sources es selectin por defecto: sin este lazyload
+                # cada suscriptor arrastraría sus fuentes y, de cada una, videos,
+                # transcripciones y resúmenes
+                source_path.selectinload(Source.users).lazyload(TelegramUser.sources),
+                # Relaciones eager por defecto que la distribución no usa
+                source_path.lazyload(Source.videos),
+                video_path.lazyload(Video.transcription),
+                transcription_path.lazyload(Transcription.summary),
+            )
+            .filter(Summary.id == summary_id)
+            .first()
+        )
+
     def search_by_text(self, query: str, limit: int = 20, use_cache: bool = True) -> list[Summary]:
         """
         Búsqueda full-text en el campo summary usando PostgreSQL.
@@ -293,22 +366,36 @@ class SummaryRepository(BaseRepository[Summary]):
             .all()
         )
 
-    def mark_as_sent(self, summary_id: UUID) -> None:
+    def mark_as_sent(self, summary_id: UUID) -> tuple[bool, datetime]:
         """
         Marca un resumen como enviado a Telegram.
 
-        Actualiza sent_to_telegram=True y sent_at con timestamp actual.
+        Actualiza sent_to_telegram=True y sent_at con timestamp actual en un
+        solo UPDATE ... RETURNING (sin SELECT previo ni refresh posterior).
 
         Args:
             summary_id: UUID del resumen
 
+        Returns:
+            Tupla (sent_to_telegram, sent_at) con los valores ya guardados
+
+        Raises:
+            NotFoundError: Si no existe resumen con ese ID
+
         Example:
-            repo.mark_as_sent(summary_id)
+            sent, sent_at = repo.mark_as_sent(summary_id)
         """
-        summary = self.get_by_id(summary_id)
-        summary.sent_to_telegram = True
-        summary.sent_at = func.now()
+        row = self.session.execute(
+            update(Summary)
+            .where(Summary.id == summary_id)
+            .values(sent_to_telegram=True, sent_at=func.now())
+            .returning(Summary.sent_to_telegram, Summary.sent_at)
+        ).one_or_none()
+        if row is None:
+            raise NotFoundError(resource_type="Summary", resource_id=summary_id)
+
         self.session.commit()
+        return row.sent_to_telegram, row.sent_at
 
     def list_paginated(
         self,
@@ -400,45 +487,19 @@ class SummaryRepository(BaseRepository[Summary]):
                 print(f"Category: {result['summary'].category}")
                 print(f"Keywords: {result['summary'].keywords}")
         """
-
-        # Crear vector de busqueda concatenando multiples campos existentes
-        # Convertir el array de keywords a texto usando array_to_string
-        search_vector = func.to_tsvector(
-            "english",
-            func.coalesce(Summary.summary_text, "")
-            + " "
-            + func.coalesce(func.array_to_string(Summary.keywords, " "), "")
-            + " "
-            + func.coalesce(Summary.category, ""),
-        )
-
-        # Query de busqueda
-        search_query = func.plainto_tsquery("english", query)
-
-        # Calcular ranking de relevancia
-        rank = func.ts_rank(search_vector, search_query).label("relevance_score")
-
-        query_obj = (
-            self.session.query(Summary, rank)
-            .filter(search_vector.op("@@")(search_query))
-            .order_by(rank.desc())
-        )
+        params = {"q": query, "limit": limit}
+        stmt = _FTS_STMT
 
         # Paginacion cursor-based
         if cursor:
-            cursor_summary = self.session.query(Summary).filter(Summary.id == cursor).first()
-            if cursor_summary:
-                # Calcular rank del cursor
-                cursor_rank = (
-                    self.session.query(rank)
-                    .filter(Summary.id == cursor)
-                    .filter(search_vector.op("@@")(search_query))
-                    .scalar()
-                )
-                if cursor_rank:
-                    query_obj = query_obj.filter(rank < cursor_rank)
-
-        results = query_obj.limit(limit).all()
+            cursor_rank = self.session.execute(
+                _FTS_CURSOR_RANK_STMT, {"q": query, "cursor": cursor}
+            ).scalar()
+            if cursor_rank:
+                stmt = _FTS_AFTER_STMT
+                params["cursor_rank"] = cursor_rank
+
+        results = self.session.execute(stmt, params).all()
 
         return [
             {"summary": summary, "relevance_score": float(score), "id": summary.id}
@@ -7,7 +7,8 @@ usuarios de Telegram y sus suscripciones a fuentes (relación M:N).
 
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, lazyload, selectinload
 
 from src.models import Source, TelegramUser
 from src.repositories.base_repository import BaseRepository
@@ -76,6 +77,31 @@ class TelegramUserRepository(BaseRepository[TelegramUser]):
             is not None
         )
 
+    def mark_bot_blocked(self, user_ids: list[UUID]) -> int:
+        """
+        Marca varios usuarios como bot_blocked=True en un único UPDATE.
+
+        No hace commit: el llamador lo confirma junto al resto de cambios
+        de su transacción (ej: el resumen distribuido).
+
+        Args:
+            user_ids: UUIDs de los usuarios que bloquearon el bot
+
+        Returns:
+            Número de usuarios actualizados
+
+        Example:
+            repo.mark_bot_blocked([user1.id, user2.id])
+            session.commit()
+        """
+        if not user_ids:
+            return 0
+
+        result = self.session.execute(
+            update(TelegramUser).where(TelegramUser.id.in_(user_ids)).values(bot_blocked=True)
+        )
+        return result.rowcount
+
     def subscribe_to_source(self, user_id: UUID, source_id: UUID) -> None:
         """
         Suscribe un usuario a una fuente.
@@ -150,7 +176,18 @@ class TelegramUserRepository(BaseRepository[TelegramUser]):
             for source in sources:
                 print(f"Suscrito a: {source.name}")
         """
-        user = self.get_by_id(user_id)
+        # Una query para el usuario y otra (SELECT IN) para sus fuentes; sin
+        # el lazyload("*") las fuentes arrastrarían sus videos y usuarios
+        # suscritos (lazy="selectin" en el modelo), que aquí no se usan
+        user = self.session.scalars(
+            select(TelegramUser)
+            .where(TelegramUser.id == user_id)
+            .options(selectinload(TelegramUser.sources).lazyload("*"))
+        ).one_or_none()
+
+        if user is None:
+            raise NotFoundError(resource_type="TelegramUser", resource_id=user_id)
+
         return user.sources
 
     def get_source_subscribers(self, source_id: UUID) -> list[TelegramUser]:
@@ -170,7 +207,16 @@ class TelegramUserRepository(BaseRepository[TelegramUser]):
             for user in subscribers:
                 send_to_telegram(user.telegram_id, summary)
         """
-        source = self.session.get(Source, source_id)
+        # Solo la fuente y sus suscriptores: no se cargan los videos de la
+        # fuente ni las demás suscripciones de cada usuario
+        source = self.session.scalars(
+            select(Source)
+            .where(Source.id == source_id)
+            .options(
+                lazyload(Source.videos),
+                selectinload(Source.users).lazyload(TelegramUser.sources),
+            )
+        ).one_or_none()
 
         if source is None:
             raise NotFoundError("Source", source_id)
@@ -11,10 +11,12 @@ import logging
 from datetime import UTC
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from src.models import Video, VideoStatus
 from src.repositories.base_repository import BaseRepository
+from src.repositories.exceptions import NotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -354,7 +356,7 @@ class VideoRepository(BaseRepository[Video]):
             Video con deleted_at establecido.
 
         Raises:
-            ValueError: Si el video no existe.
+            NotFoundError: Si el video no existe.
 
         Example:
             video = repo.soft_delete(video_id)
@@ -362,13 +364,18 @@ class VideoRepository(BaseRepository[Video]):
         """
         from datetime import datetime
 
-        video = self.get_by_id(video_id)
-        if not video:
-            raise ValueError(f"Video {video_id} not found")
+        # UPDATE ... RETURNING: comprueba la existencia en el mismo statement,
+        # sin un SELECT previo
+        video = self.session.scalars(
+            update(Video)
+            .where(Video.id == video_id)
+            .values(deleted_at=datetime.now(UTC))
+            .returning(Video)
+        ).one_or_none()
+        if video is None:
+            raise NotFoundError(resource_type="Video", resource_id=video_id)
 
-        video.deleted_at = datetime.now(UTC)
         self.session.commit()
-        self.session.refresh(video)
         return video
 
     def get_skipped_videos(self, source_id: UUID | None = None, limit: int = 50) -> list[Video]:
@@ -5,15 +5,18 @@ Proporciona una capa de abstracción sobre Redis para operaciones de caché,
 con soporte para serialización JSON, métricas de Prometheus, y fallback graceful.
 """
 
-import hashlib
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
+from fnmatch import fnmatchcase
 from functools import wraps
 from typing import Any, TypeVar
 
 import redis
+import xxhash
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 from redis.exceptions import TimeoutError as RedisTimeoutError
@@ -37,6 +40,66 @@ CACHE_DEFAULT_TTL = getattr(settings, "CACHE_DEFAULT_TTL", 3600)  # 1 hora por d
 # Timeout para operaciones Redis (100ms)
 REDIS_TIMEOUT = 0.1
 
+# Tamaño de lote para SCAN + UNLINK en invalidate_pattern()
+INVALIDATE_BATCH_SIZE = 500
+
+# Caché L1 en memoria del proceso (objetos ya deserializados).
+# delete() e invalidate_pattern() sólo expulsan de la L1 del proceso que
+# las ejecuta: tras una invalidación hecha desde otro proceso (p.ej. un
+# worker de Celery), el resto puede servir el valor anterior durante
+# CACHE_L1_TTL segundos como máximo. CACHE_L1_TTL=0 desactiva la L1.
+CACHE_L1_MAX_ITEMS = getattr(settings, "CACHE_L1_MAX_ITEMS", 1024)
+CACHE_L1_TTL = getattr(settings, "CACHE_L1_TTL", 60)  # Staleness máxima entre procesos
+
+# Centinela para distinguir "no está en L1" de un valor None cacheado
+_MISSING = object()
+
+
+# ==================== SERIALIZACIÓN ====================
+
+# Prefijo de 1 carácter con el tipo del valor almacenado. Ninguno es un
+# inicio válido de JSON, así que los valores antiguos (JSON sin prefijo)
+# se siguen leyendo sin ambigüedad.
+_PREFIX_STR = "S"
+_PREFIX_INT = "I"
+_PREFIX_JSON = "J"
+
+
+def _serialize(value: Any) -> str:
+    """
+    Serializa un valor para Redis con prefijo de tipo.
+
+    str e int se almacenan tal cual (sin pasar por json.dumps); el resto
+    se serializa a JSON.
+
+    Raises:
+        TypeError, ValueError: Si el valor no es serializable a JSON.
+    """
+    value_type = type(value)  # type() y no isinstance(): bool es subclase de int
+    if value_type is str:
+        return _PREFIX_STR + value
+    if value_type is int:
+        return _PREFIX_INT + str(value)
+    return _PREFIX_JSON + json.dumps(value, default=str)  # default=str para UUIDs, datetimes
+
+
+def _deserialize(raw: str) -> Any:
+    """
+    Deserializa un valor leído de Redis según su prefijo de tipo.
+
+    Raises:
+        ValueError: Si el valor está corrupto (incluye json.JSONDecodeError).
+    """
+    prefix = raw[:1]
+    if prefix == _PREFIX_STR:
+        return raw[1:]
+    if prefix == _PREFIX_INT:
+        return int(raw[1:])
+    if prefix == _PREFIX_JSON:
+        return json.loads(raw[1:])
+    # Valores escritos antes del prefijo de tipo: JSON plano
+    return json.loads(raw)
+
 
 # ==================== DECORADOR DE TIMING ====================
 
@@ -88,11 +151,17 @@ class CacheService:
     - health_check(): Verificar estado de Redis
 
     Características:
-    - Serialización automática JSON
+    - Serialización automática (str/int sin JSON, resto en JSON)
     - Métricas de Prometheus
     - Logging estructurado
     - Fallback graceful ante errores Redis
     - Connection pooling automático
+    - Caché L1 en memoria (LRU acotado) con los objetos ya deserializados
+
+    Los valores devueltos por get() pueden provenir de la caché L1 y ser
+    compartidos entre llamadas: tratarlos como de solo lectura. La L1 es
+    local a cada proceso, por lo que una invalidación hecha en otro proceso
+    puede tardar hasta CACHE_L1_TTL segundos en verse aquí.
     """
 
     def __init__(self):
@@ -105,6 +174,11 @@ class CacheService:
         self.enabled = CACHE_ENABLED
         self.redis_client = None
 
+        # L1: (key, cache_type) -> (expires_at monotonic, valor deserializado)
+        self._l1: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._l1_max = CACHE_L1_MAX_ITEMS
+        self._l1_lock = threading.Lock()
+
         if not self.enabled:
             logger.info("Cache disabled by configuration (CACHE_ENABLED=False)")
             return
@@ -139,6 +213,50 @@ class CacheService:
             self.redis_client = None
             metrics.cache_errors_total.labels(error_type="connection").inc()
 
+    # ==================== CACHÉ L1 (IN-PROCESS) ====================
+
+    def _l1_get(self, key: str, cache_type: str) -> Any:
+        """Devuelve el objeto de L1 si está vigente, o _MISSING."""
+        l1_key = (key, cache_type)
+        with self._l1_lock:
+            entry = self._l1.get(l1_key)
+            if entry is None:
+                return _MISSING
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._l1[l1_key]
+                return _MISSING
+
+            self._l1.move_to_end(l1_key)
+            return value
+
+    def _l1_put(self, key: str, cache_type: str, value: Any, ttl: float) -> None:
+        """Almacena un objeto deserializado en L1 (TTL acotado a CACHE_L1_TTL)."""
+        ttl = min(ttl, CACHE_L1_TTL)
+        if ttl <= 0 or self._l1_max <= 0:
+            return
+
+        with self._l1_lock:
+            l1_key = (key, cache_type)
+            self._l1[l1_key] = (time.monotonic() + ttl, value)
+            self._l1.move_to_end(l1_key)
+            while len(self._l1) > self._l1_max:
+                self._l1.popitem(last=False)
+
+    def _l1_evict(self, *keys: str) -> None:
+        """Elimina keys concretas de L1 (para todos sus cache_type)."""
+        evicted = set(keys)
+        with self._l1_lock:
+            for l1_key in [k for k in self._l1 if k[0] in evicted]:
+                del self._l1[l1_key]
+
+    def _l1_evict_pattern(self, pattern: str) -> None:
+        """Elimina de L1 las keys que coincidan con un patrón glob de Redis."""
+        with self._l1_lock:
+            for l1_key in [k for k in self._l1 if fnmatchcase(k[0], pattern)]:
+                del self._l1[l1_key]
+
     @timed("get")
     def get(self, key: str, cache_type: str = "generic") -> Any | None:
         """
@@ -149,7 +267,7 @@ class CacheService:
             cache_type: Tipo de caché para métricas (summary, user_recent, search, stats)
 
         Returns:
-            Valor deserializado desde JSON, o None si no existe o hay error
+            Valor deserializado, o None si no existe o hay error
 
         Example:
             summary_data = cache_service.get("summary:detail:123", cache_type="summary")
@@ -157,8 +275,18 @@ class CacheService:
         if not self.enabled or not self.redis_client:
             return None
 
+        # L1 hit: evita round-trip a Redis y deserialización
+        l1_value = self._l1_get(key, cache_type)
+        if l1_value is not _MISSING:
+            metrics.cache_hits_total.labels(cache_type=cache_type).inc()
+            return l1_value
+
         try:
-            value = self.redis_client.get(key)
+            # GET y PTTL en un solo round-trip (el TTL restante acota la vida en L1)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            value, ttl_ms = pipe.execute()
 
             if value is None:
                 metrics.cache_misses_total.labels(cache_type=cache_type).inc()
@@ -168,8 +296,25 @@ class CacheService:
                 )
                 return None
 
-            # Deserializar JSON
-            deserialized = json.loads(value)
+            # Deserializar según prefijo de tipo
+            try:
+                deserialized = _deserialize(value)
+            except ValueError as e:  # Incluye json.JSONDecodeError
+                logger.error(
+                    f"Failed to deserialize cached value: {e}",
+                    exc_info=True,
+                    extra={"key": key, "value": value, "error": str(e)},
+                )
+                metrics.cache_errors_total.labels(error_type="serialization").inc()
+                # Eliminar valor corrupto
+                self.delete(key)
+                return None
+
+            # Poblar L1 sin sobrevivir al TTL restante en Redis
+            if ttl_ms == -1:  # Key sin expiración
+                self._l1_put(key, cache_type, deserialized, CACHE_L1_TTL)
+            elif ttl_ms > 0:
+                self._l1_put(key, cache_type, deserialized, ttl_ms / 1000)
 
             # Métricas
             metrics.cache_hits_total.labels(cache_type=cache_type).inc()
@@ -194,17 +339,6 @@ class CacheService:
             metrics.cache_errors_total.labels(error_type="connection").inc()
             return None
 
-        except json.JSONDecodeError as e:
-            logger.error(
-                f"Failed to deserialize cached value: {e}",
-                exc_info=True,
-                extra={"key": key, "value": value, "error": str(e)},
-            )
-            metrics.cache_errors_total.labels(error_type="serialization").inc()
-            # Eliminar valor corrupto
-            self.delete(key)
-            return None
-
         except RedisError as e:
             logger.error(
                 f"Redis error on get: {e}",
@@ -227,7 +361,7 @@ class CacheService:
 
         Args:
             key: Clave de Redis
-            value: Valor a cachear (será serializado a JSON)
+            value: Valor a cachear (str/int se guardan directos, el resto en JSON)
             ttl: Time-to-live en segundos (default: CACHE_DEFAULT_TTL)
             cache_type: Tipo de caché para métricas
 
@@ -240,9 +374,11 @@ class CacheService:
         if not self.enabled or not self.redis_client:
             return False
 
+        self._l1_evict(key)
+
         try:
-            # Serializar a JSON
-            serialized = json.dumps(value, default=str)  # default=str para UUIDs, datetimes
+            # Serializar (str/int directos, resto a JSON)
+            serialized = _serialize(value)
 
             # Almacenar con TTL
             self.redis_client.setex(key, ttl, serialized)
@@ -305,6 +441,8 @@ class CacheService:
         if not self.enabled or not self.redis_client:
             return False
 
+        self._l1_evict(key)
+
         try:
             deleted_count = self.redis_client.delete(key)
 
@@ -453,9 +591,9 @@ class CacheService:
             for key, value in zip(keys, values, strict=False):
                 if value is not None:
                     try:
-                        results[key] = json.loads(value)
+                        results[key] = _deserialize(value)
                         metrics.cache_hits_total.labels(cache_type=cache_type).inc()
-                    except json.JSONDecodeError:
+                    except ValueError:
                         logger.error(f"Failed to deserialize cached value for key: {key}")
                         metrics.cache_errors_total.labels(error_type="serialization").inc()
                 else:
@@ -519,12 +657,14 @@ class CacheService:
         if not self.enabled or not self.redis_client or not data:
             return False
 
+        self._l1_evict(*data)
+
         try:
             # Usar pipeline para batch operation
             pipe = self.redis_client.pipeline()
             for key, value in data.items():
                 try:
-                    serialized = json.dumps(value, default=str)
+                    serialized = _serialize(value)
                     pipe.setex(key, ttl, serialized)
                 except (TypeError, ValueError) as e:
                     logger.error(
@@ -569,8 +709,8 @@ class CacheService:
         """
         Invalida (elimina) todas las keys que coincidan con un patrón.
 
-        ADVERTENCIA: Usa comando KEYS de Redis, que es bloqueante.
-        En producción con alto tráfico, considerar usar SCAN.
+        Usa SCAN (iterativo, no bloquea Redis como KEYS) y UNLINK (liberación
+        de memoria en background) en lotes pipelineados de INVALIDATE_BATCH_SIZE.
 
         Args:
             pattern: Patrón Redis (ej: "user:*:recent", "summary:*")
@@ -584,17 +724,26 @@ class CacheService:
         if not self.enabled or not self.redis_client:
             return 0
 
-        try:
-            # Buscar keys que coincidan con patrón
-            keys = self.redis_client.keys(pattern)
+        self._l1_evict_pattern(pattern)
 
-            if not keys:
+        try:
+            # Recorrer keys con SCAN y encolar UNLINK por lotes en un pipeline
+            pipe = self.redis_client.pipeline(transaction=False)
+            batch: list[str] = []
+            for key in self.redis_client.scan_iter(match=pattern, count=INVALIDATE_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    pipe.unlink(*batch)
+                    batch = []
+            if batch:
+                pipe.unlink(*batch)
+
+            deleted_count = sum(pipe.execute())
+
+            if not deleted_count:
                 logger.debug(f"No keys found for pattern: {pattern}")
                 return 0
 
-            # Eliminar keys en batch
-            deleted_count = self.redis_client.delete(*keys)
-
             logger.info(
                 f"Cache invalidated by pattern: {pattern}",
                 extra={
@@ -712,7 +861,10 @@ cache_service = CacheService()
 
 def hash_query(query: str) -> str:
     """
-    Genera hash MD5 de una query para usar como key de caché.
+    Genera hash xxh3-128 de una query para usar como key de caché.
+
+    No es un hash criptográfico (no hace falta para keys de caché): xxh3 es
+    mucho más rápido que MD5 y mantiene el mismo ancho de 32 caracteres hex.
 
     Normaliza la query (lowercase, strip, espacios múltiples) antes de hashear.
 
@@ -720,7 +872,7 @@ def hash_query(query: str) -> str:
         query: Query de búsqueda
 
     Returns:
-        Hash MD5 hex (32 caracteres)
+        Hash xxh3-128 hex (32 caracteres)
 
     Example:
         >>> hash_query("FastAPI Async")
@@ -732,4 +884,4 @@ def hash_query(query: str) -> str:
     """
     # Normalizar: lowercase, strip, y colapsar espacios múltiples
     normalized = " ".join(query.lower().split())
-    return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+    return xxhash.xxh3_128_hexdigest(normalized.encode("utf-8"))
@@ -599,7 +599,8 @@ class VideoProcessingService:
                 error=str(e),
             ).error("audio_file_cleanup_failed")
 
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    def _format_duration(seconds: int) -> str:
         """
         Convierte segundos a formato legible HH:MM:SS o MM:SS.
 
@@ -610,9 +611,9 @@ class VideoProcessingService:
             String formateado (ej: "35:59", "1:02:15").
 
         Example:
-            >>> service._format_duration(2159)
+            >>> VideoProcessingService._format_duration(2159)
             '35:59'
-            >>> service._format_duration(3665)
+            >>> VideoProcessingService._format_duration(3665)
             '1:01:05'
         """
         hours = seconds // 3600
@@ -21,7 +21,7 @@ from uuid import UUID
 from celery import Task
 from sqlalchemy.orm import Session
 from telegram import Bot
-from telegram.error import Forbidden, TelegramError
+from telegram.error import Forbidden, RetryAfter, TelegramError
 
 from src.bot.utils.formatters import format_summary_message
 from src.core.celery_app import celery_app
@@ -36,6 +36,14 @@ from src.repositories.telegram_user_repository import TelegramUserRepository
 
 logger = get_logger(__name__)
 
+# ==================== RATE LIMITING ====================
+
+# Telegram permite ~30 msg/s globales: escalonar envíos 50ms (20 msg/s = seguro)
+RATE_LIMIT_DELAY = 0.05
+
+# Máximo de envíos en vuelo simultáneamente
+MAX_CONCURRENT_SENDS = 20
+
 
 # ==================== CUSTOM TASK BASE ====================
 
@@ -158,9 +166,9 @@ def distribute_summary_task(self, summary_id_str: str) -> dict:
         retries=self.request.retries,
     ):
         try:
-            # Obtener resumen con eager-loading de relaciones
+            # Obtener resumen con eager-loading de video, source y suscriptores
             summary_repo = SummaryRepository(self.db)
-            summary = summary_repo.get_by_id(summary_id)
+            summary = summary_repo.get_for_distribution(summary_id)
 
             if not summary:
                 logger.error("summary_not_found")
@@ -173,7 +181,7 @@ def distribute_summary_task(self, summary_id_str: str) -> dict:
                 ).info("summary_already_sent")
                 raise SummaryAlreadySentError(f"Summary {summary_id} was already sent to Telegram")
 
-            # Obtener video y source relacionados (con eager loading)
+            # Video y source ya cargados (sin queries adicionales)
             video = summary.transcription.video
             source = video.source
 
@@ -183,9 +191,9 @@ def distribute_summary_task(self, summary_id_str: str) -> dict:
                 source_name=source.name,
             ).info("summary_relations_fetched")
 
-            # Consultar usuarios suscritos al source
+            # Usuarios suscritos al source (ya cargados con selectinload)
             user_repo = TelegramUserRepository(self.db)
-            subscribed_users = user_repo.get_users_subscribed_to_source(source.id)
+            subscribed_users = source.users
 
             # Filtrar usuarios que NO bloquearon el bot
             active_users = [user for user in subscribed_users if not user.bot_blocked]
@@ -215,18 +223,30 @@ def distribute_summary_task(self, summary_id_str: str) -> dict:
             formatted_message = format_summary_message(summary, video, source)
 
             # Distribuir a usuarios (async)
-            sent_message_ids = asyncio.run(
-                _distribute_to_users(
-                    bot=self.bot,
-                    users=active_users,
-                    message=formatted_message,
-                    summary_id=summary_id_str,
-                    user_repo=user_repo,
-                    db_session=self.db,
+            blocked_user_ids: list[UUID] = []
+            try:
+                sent_message_ids = asyncio.run(
+                    _distribute_to_users(
+                        bot=self.bot,
+                        users=active_users,
+                        message=formatted_message,
+                        summary_id=summary_id_str,
+                        blocked_user_ids=blocked_user_ids,
+                    )
                 )
-            )
+            except TelegramError:
+                # Rate limit: persistir los bloqueos ya detectados antes de
+                # que Celery reintente (el resumen sigue pendiente de envío)
+                if blocked_user_ids:
+                    user_repo.mark_bot_blocked(blocked_user_ids)
+                    self.db.commit()
+                raise
+
+            # Marcar en un único UPDATE a los usuarios que bloquearon el bot
+            if blocked_user_ids:
+                user_repo.mark_bot_blocked(blocked_user_ids)
 
-            # Actualizar summary con IDs de mensajes enviados
+            # Actualizar summary con IDs de mensajes enviados (mismo commit)
             summary.telegram_message_ids = sent_message_ids
             summary.sent_to_telegram = True
             summary.sent_at = datetime.now(UTC)
@@ -267,31 +287,86 @@ async def _distribute_to_users(
     users: list,
     message: str,
     summary_id: str,
-    user_repo: TelegramUserRepository,
-    db_session: Session,
+    blocked_user_ids: list[UUID],
 ) -> dict[str, int]:
     """
     Distribuye el mensaje a todos los usuarios suscritos.
 
-    Envía el mensaje a cada usuario y maneja errores individuales
-    (usuario bloqueó bot, chat no existe, etc.). Respeta rate limits
-    de Telegram (30 mensajes/segundo).
+    Los envíos se lanzan concurrentemente con asyncio.gather (como mucho
+    MAX_CONCURRENT_SENDS en vuelo) y escalonados RATE_LIMIT_DELAY entre sí,
+    de modo que se respeta el rate limit de Telegram (30 mensajes/segundo)
+    sin pagar la latencia de cada envío de forma secuencial. Los errores
+    individuales (usuario bloqueó bot, chat no existe, etc.) no detienen
+    al resto, y un rate limit sólo se propaga cuando todos los envíos han
+    terminado, con blocked_user_ids ya completo.
 
     Args:
         bot: Instancia de Bot de Telegram.
         users: Lista de TelegramUser suscritos.
         message: Mensaje formateado con markdown.
         summary_id: UUID del resumen (para logging).
-        user_repo: Repositorio de usuarios (para marcar bot_blocked).
-        db_session: Sesión de BD (para commits incrementales).
+        blocked_user_ids: Acumulador de usuarios que bloquearon el bot (a
+            marcar en BD en bloque, también si se propaga un rate limit).
 
     Returns:
-        dict: Mapeo de {chat_id: message_id} de mensajes enviados exitosamente.
+        Mapeo de {chat_id: message_id} de mensajes enviados exitosamente.
+
+    Raises:
+        RetryAfter: Si Telegram aplica rate limit (Celery reintentará la tarea).
     """
-    sent_message_ids = {}
-    RATE_LIMIT_DELAY = 0.05  # 50ms entre envíos (20 msg/s = seguro)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+    results = await asyncio.gather(
+        *(
+            _send_to_user(
+                bot=bot,
+                user=user,
+                message=message,
+                summary_id=summary_id,
+                blocked_user_ids=blocked_user_ids,
+                semaphore=semaphore,
+                start_delay=index * RATE_LIMIT_DELAY,
+            )
+            for index, user in enumerate(users)
+        ),
+        return_exceptions=True,
+    )
+
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+
+    return dict(filter(None, results))
 
-    for user in users:
+
+async def _send_to_user(
+    bot: Bot,
+    user,
+    message: str,
+    summary_id: str,
+    blocked_user_ids: list[UUID],
+    semaphore: asyncio.Semaphore,
+    start_delay: float,
+) -> tuple[str, int] | None:
+    """
+    Envía el mensaje a un usuario y maneja sus errores individuales.
+
+    Args:
+        bot: Instancia de Bot de Telegram.
+        user: TelegramUser destinatario.
+        message: Mensaje formateado con markdown.
+        summary_id: UUID del resumen (para logging).
+        blocked_user_ids: Acumulador de usuarios que bloquearon el bot.
+        semaphore: Limita el número de envíos simultáneos.
+        start_delay: Segundos a esperar antes de enviar (escalonado por rate limit).
+
+    Returns:
+        Tupla (chat_id, message_id) si se envió, None si falló.
+    """
+    # Rate limiting: escalonar el inicio de cada envío
+    await asyncio.sleep(start_delay)
+
+    async with semaphore:
         try:
             # Enviar mensaje con markdown v2
             sent_message = await bot.send_message(
@@ -301,17 +376,14 @@ async def _distribute_to_users(
                 disable_web_page_preview=False,
             )
 
-            # Guardar ID del mensaje enviado
-            sent_message_ids[str(user.telegram_id)] = sent_message.message_id
-
             logger.bind(
                 summary_id=summary_id,
                 telegram_user_id=user.telegram_id,
                 message_id=sent_message.message_id,
             ).debug("message_sent_to_user")
 
-            # Rate limiting: esperar entre envíos
-            await asyncio.sleep(RATE_LIMIT_DELAY)
+            # Guardar ID del mensaje enviado
+            return str(user.telegram_id), sent_message.message_id
 
         except Forbidden as e:
             # Usuario bloqueó el bot o chat no existe
@@ -322,9 +394,8 @@ async def _distribute_to_users(
                 error=str(e),
             ).warning("user_blocked_bot")
 
-            # Marcar usuario como bot_blocked en BD
-            user.bot_blocked = True
-            db_session.commit()
+            # Se marcará como bot_blocked en BD junto al resto, en un solo UPDATE
+            blocked_user_ids.append(user.id)
 
         except TelegramError as e:
             # Otros errores de Telegram (rate limit, timeout, etc.)
@@ -337,7 +408,7 @@ async def _distribute_to_users(
             ).error("telegram_send_failed")
 
             # Si es rate limit, propagar para retry
-            if "too many requests" in str(e).lower():
+            if isinstance(e, RetryAfter) or "too many requests" in str(e).lower():
                 raise
 
             # Otros errores: continuar con siguiente usuario
@@ -352,4 +423,4 @@ async def _distribute_to_users(
             ).exception("unexpected_error_sending_message")
             # Continuar con siguiente usuario
 
-    return sent_message_ids
+        return None
@@ -18,25 +18,35 @@ from src.models.base import Base
 from src.models.source import Source
 from src.models.user import User
 from src.models.video import Video, VideoStatus
+from tests.conftest import truncate_all_tables
 
 # ==================== DATABASE FIXTURES ====================
 
 
-@pytest.fixture(scope="function")
-def db_session():
+@pytest.fixture(scope="session")
+def db_engine():
     """
-    Crea una sesion de BD para tests.
+    Engine de la BD de desarrollo con el schema creado UNA VEZ por sesión.
 
-    Cada test obtiene una BD limpia y aislada.
-    Usa la BD real de desarrollo (requiere PostgreSQL corriendo).
+    create_all consulta el catálogo tabla por tabla; hacerlo en cada test
+    era el grueso del coste de db_session.
     """
     from src.core.database import engine
 
-    # Crear todas las tablas (idempotente si ya existen)
     Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="function")
+def db_session(db_engine):
+    """
+    Crea una sesion de BD para tests.
 
+    Cada test obtiene una BD limpia y aislada.
+    Usa la BD real de desarrollo (requiere PostgreSQL corriendo).
+    """
     # Crear sesion
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
     session = TestingSessionLocal()
 
     try:
@@ -46,14 +56,11 @@ def db_session():
         session.rollback()
         session.close()
 
-        # Limpiar datos pero mantener schema
-        # Esto es más rápido y evita race conditions
-        with engine.begin() as conn:
-            for table in reversed(Base.metadata.sorted_tables):
-                conn.execute(table.delete())
+        # Limpiar datos pero mantener schema (los endpoints hacen commit,
+        # así que no basta con el rollback)
+        truncate_all_tables(db_engine)
 
         # NO hacer drop_all aquí - causa race conditions entre tests
-        # Base.metadata.drop_all(engine)
 
 
 # ==================== FASTAPI CLIENT FIXTURE ====================
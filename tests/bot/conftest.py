@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from telegram import Chat, Message, Update, User
 
 from src.models.base import Base
+from tests.conftest import truncate_all_tables
 
 
 @pytest.fixture
@@ -97,8 +98,22 @@ def mock_context():
     return context
 
 
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Engine de la BD de desarrollo con el schema creado UNA VEZ por sesión.
+
+    create_all consulta el catálogo tabla por tabla; hacerlo en cada test
+    era el grueso del coste de db_session.
+    """
+    from src.core.database import engine
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
 @pytest.fixture
-def db_session() -> Session:
+def db_session(db_engine) -> Session:
     """
     Crea una sesión de BD para tests (reutiliza fixture de API).
 
@@ -107,13 +122,8 @@ def db_session() -> Session:
     Yields:
         Sesión de SQLAlchemy con BD temporal
     """
-    from src.core.database import engine
-
-    # Crear todas las tablas
-    Base.metadata.create_all(engine)
-
     # Crear sesión
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
     session = TestingSessionLocal()
 
     try:
@@ -122,5 +132,5 @@ def db_session() -> Session:
         # Rollback para deshacer cambios del test
         session.rollback()
         session.close()
-        # Limpiar todas las tablas
-        Base.metadata.drop_all(engine)
+        # Vaciar las tablas: un TRUNCATE en lugar de drop_all + create_all por test
+        truncate_all_tables(db_engine)
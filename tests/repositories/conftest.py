@@ -9,34 +9,77 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 
-from src.core.config import settings
 from src.models import Source, Summary, TelegramUser, Transcription, Video, VideoStatus
 from src.models.base import Base
+from tests.conftest import TEST_DATABASE_URL
 
-# Engine de test (reutiliza la misma BD pero con transacciones aisladas)
-test_engine = create_engine(
-    str(settings.DATABASE_URL),
-    pool_pre_ping=True,
-    echo=False,  # Silenciar logs SQL en tests
-)
+
+@pytest.fixture(scope="session")
+def test_engine(worker_id):
+    """
+    Engine de test único para toda la sesión de pytest.
+
+    Usa la BD de tests (TEST_DATABASE_URL), nunca la de la aplicación; el
+    aislamiento lo da la transacción externa de cada db_session. Con
+    `pytest -n auto` cada worker de xdist (gw0, gw1, ...) usa su propio
+    schema (test_repos_gw0, ...): sin él, dos workers que insertan la misma
+    clave única (p.ej. la URL de sample_source) se bloquearían entre sí
+    hasta el rollback del otro. Sin xdist, worker_id es "master". El schema
+    se elimina al terminar la sesión.
+    """
+    schema = f"test_repos_{worker_id}"
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        pool_pre_ping=True,
+        echo=False,  # Silenciar logs SQL en tests
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_search_path(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'SET search_path TO "{schema}"')
+        cursor.close()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+
+    yield engine
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def tables(test_engine):
+    """
+    Crea las tablas una sola vez por sesión (no por test).
+
+    El schema del worker se elimina al terminar la sesión, así que cada
+    ejecución parte de un schema vacío; checkfirst=True sólo importa si
+    una ejecución abortada lo dejó en pie.
+    """
+    Base.metadata.create_all(bind=test_engine, checkfirst=True)
 
 
 @pytest.fixture(scope="function")
-def db_session():
+def db_session(test_engine, tables):
     """
     Fixture que proporciona una sesión de BD con rollback automático.
 
     Cada test se ejecuta en una transacción que se revierte al finalizar,
-    garantizando que los tests no ensucien la base de datos.
+    garantizando que los tests no ensucien la base de datos. La sesión
+    trabaja dentro de un SAVEPOINT (join_transaction_mode="create_savepoint"),
+    así que los commit() de tests y repositories no confirman nada.
 
     Uso:
         def test_create_source(db_session):
             source = Source(name="Test", url="https://test.com")
             db_session.add(source)
-            db_session.commit()
+            db_session.flush()
             # Al finalizar el test, todo se revierte automáticamente
 
     Yields:
@@ -46,16 +89,12 @@ def db_session():
     connection = test_engine.connect()
     transaction = connection.begin()
 
-    # Crear sesión ligada a la transacción
-    TestSessionLocal = sessionmaker(
+    # Crear sesión ligada a la transacción (sin DDL por test)
+    session = Session(
         bind=connection,
-        autocommit=False,
+        join_transaction_mode="create_savepoint",
         autoflush=False,
     )
-    session = TestSessionLocal()
-
-    # Asegurar que las tablas existen
-    Base.metadata.create_all(bind=test_engine)
 
     yield session
 
@@ -92,8 +131,7 @@ def sample_source(db_session) -> Source:
         extra_metadata={"subscriber_count": 1000, "language": "en"},
     )
     db_session.add(source)
-    db_session.commit()
-    db_session.refresh(source)
+    db_session.flush()
     return source
 
 
@@ -118,8 +156,7 @@ def inactive_source(db_session) -> Source:
         extra_metadata={},
     )
     db_session.add(source)
-    db_session.commit()
-    db_session.refresh(source)
+    db_session.flush()
     return source
 
 
@@ -158,8 +195,7 @@ def source_factory(db_session):
             extra_metadata=extra_metadata or {},
         )
         db_session.add(source)
-        db_session.commit()
-        db_session.refresh(source)
+        db_session.flush()
         return source
 
     return _create_source
@@ -199,8 +235,7 @@ def sample_video(db_session, sample_source) -> Video:
         extra_metadata={"view_count": 1000, "like_count": 50},
     )
     db_session.add(video)
-    db_session.commit()
-    db_session.refresh(video)
+    db_session.flush()
     return video
 
 
@@ -255,8 +290,7 @@ def video_factory(db_session):
             extra_metadata=extra_metadata or {},
         )
         db_session.add(video)
-        db_session.commit()
-        db_session.refresh(video)
+        db_session.flush()
         return video
 
     return _create_video
@@ -297,8 +331,7 @@ def sample_transcription(db_session, sample_video) -> Transcription:
         segments=None,  # Sin segmentos por defecto
     )
     db_session.add(transcription)
-    db_session.commit()
-    db_session.refresh(transcription)
+    db_session.flush()
     return transcription
 
 
@@ -350,8 +383,7 @@ def transcription_factory(db_session):
             segments=segments,
         )
         db_session.add(transcription)
-        db_session.commit()
-        db_session.refresh(transcription)
+        db_session.flush()
         return transcription
 
     return _create_transcription
@@ -399,8 +431,7 @@ def sample_summary(db_session, sample_transcription) -> Summary:
         telegram_message_ids=None,
     )
     db_session.add(summary)
-    db_session.commit()
-    db_session.refresh(summary)
+    db_session.flush()
     return summary
 
 
@@ -475,8 +506,7 @@ def summary_factory(db_session):
             telegram_message_ids=None,
         )
         db_session.add(summary)
-        db_session.commit()
-        db_session.refresh(summary)
+        db_session.flush()
         return summary
 
     return _create_summary
@@ -513,8 +543,7 @@ def sample_telegram_user(db_session) -> TelegramUser:
         language_code="es",
     )
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    db_session.flush()
     return user
 
 
@@ -563,8 +592,7 @@ def telegram_user_factory(db_session):
             language_code=language_code,
         )
         db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
+        db_session.flush()
         return user
 
     return _create_telegram_user
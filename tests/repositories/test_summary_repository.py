@@ -18,10 +18,11 @@ sent_at y telegram_message_ids NO están implementados en el modelo actual.
 Se requiere migración de BD para agregar estos campos.
 """
 
-import time
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
 import pytest
+from sqlalchemy import exists, inspect, select
 from sqlalchemy.exc import IntegrityError
 
 from src.models import Summary, Transcription, Video, VideoStatus
@@ -156,7 +157,7 @@ def test_get_by_transcription_id_not_found(db_session, sample_transcription):
         published_at=datetime.now(UTC),
     )
     db_session.add(video_without_summary)
-    db_session.commit()
+    db_session.flush()
 
     transcription_without_summary = Transcription(
         video_id=video_without_summary.id,
@@ -166,7 +167,7 @@ def test_get_by_transcription_id_not_found(db_session, sample_transcription):
         duration_seconds=300,
     )
     db_session.add(transcription_without_summary)
-    db_session.commit()
+    db_session.flush()
 
     found = repo.get_by_transcription_id(transcription_without_summary.id)
 
@@ -185,9 +186,10 @@ def test_get_recent_returns_ordered_by_created_at_desc(
     """
     repo = SummaryRepository(db_session)
 
-    # Crear múltiples transcripciones y resúmenes con delays para timestamps diferentes
+    # Crear múltiples transcripciones y resúmenes con timestamps diferentes
     from src.models import Video
 
+    base_time = datetime(2024, 1, 1, tzinfo=UTC)
     summaries_created = []
 
     for i in range(5):
@@ -201,7 +203,7 @@ def test_get_recent_returns_ordered_by_created_at_desc(
             published_at=datetime.now(UTC),
         )
         db_session.add(video)
-        db_session.commit()
+        db_session.flush()
 
         trans = transcription_factory(
             video_id=video.id,
@@ -209,16 +211,18 @@ def test_get_recent_returns_ordered_by_created_at_desc(
             language="en",
         )
 
-        # Delay mayor para asegurar timestamps diferentes en PostgreSQL
-        time.sleep(0.1)
-
         summary = summary_factory(
             transcription_id=trans.id,
             summary_text=f"Summary {i}",
             category="concept",
         )
+        # Timestamps explícitos: NOW() es constante dentro de la transacción
+        # del test, así que un sleep no los diferenciaría
+        summary.created_at = base_time + timedelta(minutes=i)
         summaries_created.append(summary)
 
+    db_session.flush()
+
     # Obtener 3 más recientes
     recent = repo.get_recent(limit=3)
 
@@ -255,7 +259,7 @@ def test_get_recent_respects_limit(
             published_at=datetime.now(UTC),
         )
         db_session.add(video)
-        db_session.commit()
+        db_session.flush()
 
         trans = transcription_factory(
             video_id=video.id,
@@ -311,7 +315,7 @@ def test_search_by_text_full_text_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video1)
-    db_session.commit()
+    db_session.flush()
 
     trans1 = transcription_factory(video_id=video1.id, text="FastAPI content", language="es")
     sum1 = summary_factory(
@@ -332,7 +336,7 @@ def test_search_by_text_full_text_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video2)
-    db_session.commit()
+    db_session.flush()
 
     trans2 = transcription_factory(video_id=video2.id, text="Async content", language="es")
     sum2 = summary_factory(
@@ -353,7 +357,7 @@ def test_search_by_text_full_text_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video3)
-    db_session.commit()
+    db_session.flush()
 
     trans3 = transcription_factory(video_id=video3.id, text="Docker content", language="es")
     sum3 = summary_factory(
@@ -407,7 +411,7 @@ def test_search_by_text_respects_limit(
             published_at=datetime.now(UTC),
         )
         db_session.add(video)
-        db_session.commit()
+        db_session.flush()
 
         trans = transcription_factory(video_id=video.id, text=f"Python content {i}", language="es")
         summary_factory(
@@ -447,7 +451,7 @@ def test_get_by_category_filters_correctly(
         published_at=datetime.now(UTC),
     )
     db_session.add(video_fw)
-    db_session.commit()
+    db_session.flush()
 
     trans_fw = transcription_factory(video_id=video_fw.id, text="Framework content", language="es")
     sum_fw = summary_factory(
@@ -468,7 +472,7 @@ def test_get_by_category_filters_correctly(
         published_at=datetime.now(UTC),
     )
     db_session.add(video_lang)
-    db_session.commit()
+    db_session.flush()
 
     trans_lang = transcription_factory(
         video_id=video_lang.id, text="Language content", language="es"
@@ -491,7 +495,7 @@ def test_get_by_category_filters_correctly(
         published_at=datetime.now(UTC),
     )
     db_session.add(video_tool)
-    db_session.commit()
+    db_session.flush()
 
     trans_tool = transcription_factory(video_id=video_tool.id, text="Tool content", language="es")
     sum_tool = summary_factory(
@@ -551,7 +555,7 @@ def test_search_by_keyword_array_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video1)
-    db_session.commit()
+    db_session.flush()
 
     trans1 = transcription_factory(video_id=video1.id, text="FastAPI content", language="es")
     sum1 = summary_factory(
@@ -572,7 +576,7 @@ def test_search_by_keyword_array_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video2)
-    db_session.commit()
+    db_session.flush()
 
     trans2 = transcription_factory(video_id=video2.id, text="Docker content", language="es")
     sum2 = summary_factory(
@@ -593,7 +597,7 @@ def test_search_by_keyword_array_search(
         published_at=datetime.now(UTC),
     )
     db_session.add(video3)
-    db_session.commit()
+    db_session.flush()
 
     trans3 = transcription_factory(video_id=video3.id, text="Async content", language="es")
     sum3 = summary_factory(
@@ -701,6 +705,39 @@ def test_relationship_chain_summary_to_video_to_source(db_session, sample_summar
     assert summary.transcription.video.source.name == "Test Channel"
 
 
+def test_get_for_distribution_loads_chain_and_subscribers(
+    db_session, sample_summary, telegram_user_factory, count_queries
+):
+    """
+    Test que valida que get_for_distribution() carga todo lo necesario para Telegram.
+
+    Verifica:
+    - Carga la cadena Summary → Transcription → Video → Source
+    - Los usuarios suscritos al source vienen ya cargados
+    - Solo 2 consultas (JOIN + SELECT IN), sin cascada a las fuentes de los usuarios
+    - Retorna None si el resumen no existe
+    """
+    source = sample_summary.transcription.video.source
+    user = telegram_user_factory(telegram_id=333333333, username="subscriber")
+    user.sources.append(source)
+    db_session.flush()
+    db_session.expire_all()
+
+    repo = SummaryRepository(db_session)
+    with count_queries() as queries:
+        summary = repo.get_for_distribution(sample_summary.id)
+
+    assert len(queries) == 2
+
+    loaded_source = summary.transcription.video.source
+    assert loaded_source.name == "Test Channel"
+    assert "users" not in inspect(loaded_source).unloaded
+    assert [u.telegram_id for u in loaded_source.users] == [333333333]
+    assert "sources" in inspect(loaded_source.users[0]).unloaded
+
+    assert repo.get_for_distribution(uuid4()) is None
+
+
 def test_cascade_delete_transcription_deletes_summary(
     db_session, sample_transcription, summary_factory
 ):
@@ -710,8 +747,6 @@ def test_cascade_delete_transcription_deletes_summary(
     Verifica:
     - Al borrar una transcripción, su resumen también se borra (ON DELETE CASCADE)
     """
-    repo = SummaryRepository(db_session)
-
     # Crear resumen
     summary = summary_factory(
         transcription_id=sample_transcription.id,
@@ -722,10 +757,11 @@ def test_cascade_delete_transcription_deletes_summary(
 
     # Eliminar la transcripción
     db_session.delete(sample_transcription)
-    db_session.commit()
+    db_session.flush()
 
-    # Verificar que el resumen también se eliminó
-    assert repo.exists(summary_id) is False
+    # Verificar que el resumen también se eliminó (EXISTS consulta la BD,
+    # no el identity map, así que no hace falta expirar la sesión)
+    assert not db_session.scalar(select(exists().where(Summary.id == summary_id)))
 
 
 # ==================== TEST CAMPO JSONB ====================
@@ -185,6 +185,30 @@ def test_unique_constraint_telegram_id(db_session, telegram_user_factory):
     assert "unique" in str(exc_info.value).lower() or "duplicate" in str(exc_info.value).lower()
 
 
+def test_mark_bot_blocked_updates_only_given_users(db_session, telegram_user_factory):
+    """
+    Test que valida que mark_bot_blocked() marca varios usuarios en un UPDATE.
+
+    Verifica:
+    - Los usuarios indicados quedan con bot_blocked=True
+    - El resto de usuarios no se modifica
+    - Retorna el número de filas actualizadas
+    """
+    repo = TelegramUserRepository(db_session)
+    user1 = telegram_user_factory(telegram_id=222222221, username="blocked1")
+    user2 = telegram_user_factory(telegram_id=222222222, username="blocked2")
+    user3 = telegram_user_factory(telegram_id=222222223, username="active")
+
+    updated = repo.mark_bot_blocked([user1.id, user2.id])
+    db_session.commit()
+
+    assert updated == 2
+    assert user1.bot_blocked is True
+    assert user2.bot_blocked is True
+    assert user3.bot_blocked is False
+    assert repo.mark_bot_blocked([]) == 0
+
+
 # ==================== TEST SUSCRIPCIONES M:N ====================
 
 
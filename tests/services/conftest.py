@@ -0,0 +1,60 @@
+"""
+Fixtures para tests de servicios.
+
+Proporciona fixtures comunes:
+- redis_test_db: DB de Redis propia del worker de pytest-xdist
+- redis_pool: Pool de conexiones Redis compartido por toda la sesión
+"""
+
+import pytest
+import redis
+
+from src.core.config import settings
+from src.services.cache_service import REDIS_TIMEOUT
+
+# DB de Redis reservada para tests (los workers de xdist bajan desde aquí)
+TEST_CACHE_DB = 15
+
+# DBs 0 (Celery) y 1 (caché) nunca se usan en tests
+TEST_CACHE_DB_COUNT = 14
+
+
+@pytest.fixture(scope="session")
+def redis_test_db(worker_id):
+    """
+    DB de Redis para el worker actual: 15 sin xdist, 15 - N para el worker gwN.
+
+    Cada test vacía su DB al terminar (FLUSHDB), así que dos workers nunca
+    pueden compartirla: con más de TEST_CACHE_DB_COUNT workers se falla en
+    lugar de reutilizar DBs.
+    """
+    if worker_id == "master":
+        return TEST_CACHE_DB
+
+    worker_index = int(worker_id.removeprefix("gw"))
+    if worker_index >= TEST_CACHE_DB_COUNT:
+        pytest.fail(
+            f"Redis sólo tiene {TEST_CACHE_DB_COUNT} DBs libres para tests: "
+            f"usar -n {TEST_CACHE_DB_COUNT} como máximo"
+        )
+    return TEST_CACHE_DB - worker_index
+
+
+@pytest.fixture(scope="session")
+def redis_pool(redis_test_db):
+    """
+    Pool de conexiones Redis reutilizado entre tests.
+
+    Evita abrir una conexión TCP nueva (handshake + PING) por cada
+    CacheService creado en los tests.
+    """
+    redis_url = str(settings.REDIS_URL).rsplit("/", 1)[0] + f"/{redis_test_db}"
+    pool = redis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=16,
+        decode_responses=True,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT,
+    )
+    yield pool
+    pool.disconnect()
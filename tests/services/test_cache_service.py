@@ -12,10 +12,12 @@ Tests de operaciones básicas de caché con Redis:
 - manejo de errores
 """
 
+import time
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+import redis
 
 from src.services.cache_service import CacheService, hash_query
 
@@ -23,12 +25,16 @@ from src.services.cache_service import CacheService, hash_query
 
 
 @pytest.fixture
-def cache_service():
-    """Fixture de CacheService con Redis real (DB 15 para tests)."""
-    with patch("src.services.cache_service.CACHE_DB", 15):
+def cache_service(redis_pool, redis_test_db):
+    """Fixture de CacheService con Redis real (DB de tests propia del worker)."""
+    client = redis.Redis(connection_pool=redis_pool)
+    with (
+        patch("src.services.cache_service.CACHE_DB", redis_test_db),
+        patch("src.services.cache_service.redis.from_url", return_value=client),
+    ):
         service = CacheService()
         yield service
-        # Cleanup: flush test DB después de cada test
+        # Cleanup: la DB es exclusiva del worker, se vacía entera
         if service.enabled and service.redis_client:
             service.redis_client.flushdb()
 
@@ -109,6 +115,26 @@ def test_set_and_get_dict(cache_service):
     assert cached["keywords"] == ["python", "async"]
 
 
+def test_set_stores_str_and_int_without_json(cache_service):
+    """Test: str e int se guardan con prefijo de tipo, sin json.dumps."""
+    cache_service.set("test:raw_str", "Hello", ttl=60)
+    cache_service.set("test:raw_int", 42, ttl=60)
+    cache_service.set("test:raw_bool", True, ttl=60)
+
+    assert cache_service.redis_client.get("test:raw_str") == "SHello"
+    assert cache_service.redis_client.get("test:raw_int") == "I42"
+    assert cache_service.get("test:raw_int") == 42
+    # bool no se confunde con int
+    assert cache_service.get("test:raw_bool") is True
+
+
+def test_get_legacy_json_value(cache_service):
+    """Test: get() lee valores JSON escritos sin prefijo de tipo."""
+    cache_service.redis_client.set("test:legacy", '{"id": "123"}')
+
+    assert cache_service.get("test:legacy") == {"id": "123"}
+
+
 def test_set_with_uuid(cache_service):
     """Test: set() serializa UUIDs correctamente."""
     key = "test:uuid"
@@ -132,19 +158,19 @@ def test_get_nonexistent_key(cache_service):
 
 def test_set_with_ttl(cache_service):
     """Test: TTL se aplica correctamente."""
-    import time
-
     key = "test:ttl"
     value = "expires soon"
 
     # Set con TTL de 1 segundo
     cache_service.set(key, value, ttl=1, cache_type="test")
 
-    # Verificar que existe
+    # Verificar que existe y que Redis tiene el TTL aplicado
     assert cache_service.exists(key) is True
+    assert 0 < cache_service.redis_client.pttl(key) <= 1000
 
-    # Esperar a que expire
-    time.sleep(1.1)
+    # Acortar el TTL a 10ms en lugar de esperar 1s de reloj real
+    cache_service.redis_client.pexpire(key, 10)
+    time.sleep(0.02)
 
     # Verificar que expiró
     cached = cache_service.get(key, cache_type="test")
@@ -234,6 +260,62 @@ def test_get_or_set_cache_hit(cache_service):
     assert len(fetcher_called) == 0  # Fetcher NO se ejecutó
 
 
+# ==================== TESTS DE CACHÉ L1 ====================
+
+
+def test_get_served_from_l1_on_repeat_hit(mock_cache_service):
+    """Test: un segundo get() de la misma key no vuelve a consultar Redis."""
+    service, mock_client = mock_cache_service
+    mock_client.pipeline.return_value.execute.return_value = ['{"data": "from redis"}', 60_000]
+
+    first = service.get("test:l1", cache_type="test")
+    second = service.get("test:l1", cache_type="test")
+
+    assert first == second == {"data": "from redis"}
+    assert mock_client.pipeline.return_value.execute.call_count == 1
+
+
+def test_l1_keyed_by_cache_type(mock_cache_service):
+    """Test: la misma key con distinto cache_type no comparte entrada en L1."""
+    service, mock_client = mock_cache_service
+    mock_client.pipeline.return_value.execute.return_value = ['"value"', 60_000]
+
+    service.get("test:l1", cache_type="summary")
+    service.get("test:l1", cache_type="search")
+
+    assert mock_client.pipeline.return_value.execute.call_count == 2
+    assert set(service._l1) == {("test:l1", "summary"), ("test:l1", "search")}
+
+
+def test_l1_evicted_on_delete_and_invalidate(mock_cache_service):
+    """Test: delete() e invalidate_pattern() eliminan las entradas de L1."""
+    service, mock_client = mock_cache_service
+    mock_client.pipeline.return_value.execute.return_value = ['"value"', 60_000]
+    mock_client.delete.return_value = 1
+
+    service.get("user:1:recent", cache_type="user_recent")
+    service.get("user:1:recent", cache_type="generic")
+    service.get("user:2:recent", cache_type="user_recent")
+    assert ("user:1:recent", "user_recent") in service._l1
+
+    service.delete("user:1:recent")
+    assert set(service._l1) == {("user:2:recent", "user_recent")}
+
+    mock_client.pipeline.return_value.execute.return_value = [0]  # UNLINK pipelineado
+    service.invalidate_pattern("user:*:recent")
+    assert not service._l1
+
+
+def test_l1_not_populated_for_expired_key(mock_cache_service):
+    """Test: no se cachea en L1 una key cuyo TTL en Redis ya venció."""
+    service, mock_client = mock_cache_service
+    mock_client.pipeline.return_value.execute.return_value = ['"value"', -2]
+
+    service.get("test:expired")
+
+    assert not service._l1
+
+
 # ==================== TESTS DE BATCH OPERATIONS ====================
 
 
@@ -312,6 +394,22 @@ def test_invalidate_pattern(cache_service):
     assert cache_service.get("summary:detail:123", cache_type="test") == "other"
 
 
+def test_invalidate_pattern_uses_scan_and_unlink(mock_cache_service):
+    """Test: invalidate_pattern() usa SCAN + UNLINK pipelineado (no KEYS + DEL)."""
+    service, mock_client = mock_cache_service
+    mock_client.scan_iter.return_value = iter(["user:1:recent", "user:2:recent"])
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [2]
+    mock_client.pipeline.return_value = mock_pipeline
+
+    deleted_count = service.invalidate_pattern("user:*:recent")
+
+    assert deleted_count == 2
+    mock_pipeline.unlink.assert_called_once_with("user:1:recent", "user:2:recent")
+    mock_client.keys.assert_not_called()
+    mock_client.delete.assert_not_called()
+
+
 def test_invalidate_pattern_no_matches(cache_service):
     """Test: invalidate_pattern() retorna 0 si no hay matches."""
     deleted_count = cache_service.invalidate_pattern("nonexistent:*:pattern")
@@ -349,7 +447,7 @@ def test_hash_query_consistent():
     """Test: hash_query() genera mismo hash para misma query (normalizada)."""
     query1 = "fastapi async"  # Misma query lowercase
     query2 = "fastapi async"
-    query3 = "  fastapi   async  "  # Con espacios extra (strip normaliza)
+    query3 = "  fastapi   async  "  # Con espacios extra (se colapsan al normalizar)
 
     hash1 = hash_query(query1)
     hash2 = hash_query(query2)
@@ -357,7 +455,7 @@ def test_hash_query_consistent():
 
     # Todos deberían generar mismo hash (normalización)
     assert hash1 == hash2 == hash3
-    assert len(hash1) == 32  # MD5 hex tiene 32 caracteres
+    assert len(hash1) == 32  # xxh3-128 hex tiene 32 caracteres
 
     # Test adicional: mayúsculas/minúsculas dan mismo hash
     hash_upper = hash_query("FastAPI Async")
@@ -384,13 +482,12 @@ def test_set_invalid_value_type(cache_service):
     invalid_value = {}
     invalid_value["self"] = invalid_value
 
-    # Debería manejar el error y retornar False
+    # El encoder C de json detecta el ciclo al revisitar el dict (ValueError)
+    # y set() lo rechaza sin llegar a escribir en Redis
     result = cache_service.set(key, invalid_value, ttl=60, cache_type="test")
 
-    # Dependiendo de la implementación, puede fallar o no
-    # Si JSON logra serializar con default=str, será True
-    # Si no, será False
-    assert isinstance(result, bool)
+    assert result is False
+    assert cache_service.exists(key) is False
 
 
 def test_get_corrupted_value(cache_service):
@@ -447,7 +544,7 @@ def test_get_with_redis_timeout(mock_cache_service):
     from redis.exceptions import TimeoutError as RedisTimeoutError
 
     service, mock_client = mock_cache_service
-    mock_client.get.side_effect = RedisTimeoutError("Redis timeout")
+    mock_client.pipeline.return_value.execute.side_effect = RedisTimeoutError("Redis timeout")
 
     result = service.get("test:key")
 
@@ -471,7 +568,7 @@ def test_get_with_redis_connection_error(mock_cache_service):
     from redis.exceptions import ConnectionError as RedisConnectionError
 
     service, mock_client = mock_cache_service
-    mock_client.get.side_effect = RedisConnectionError("Connection lost")
+    mock_client.pipeline.return_value.execute.side_effect = RedisConnectionError("Connection lost")
 
     result = service.get("test:key")
 
@@ -653,7 +750,7 @@ def test_hash_query_with_empty_string():
     # Debe generar el mismo hash
     assert hash1 == hash2
     assert isinstance(hash1, str)
-    assert len(hash1) == 32  # MD5 hex
+    assert len(hash1) == 32  # xxh3-128 hex
 
 
 def test_hash_query_with_unicode():
@@ -662,4 +759,4 @@ def test_hash_query_with_unicode():
     hash_result = hash_query(query)
 
     assert isinstance(hash_result, str)
-    assert len(hash_result) == 32  # MD5 hex
+    assert len(hash_result) == 32  # xxh3-128 hex
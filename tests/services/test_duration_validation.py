@@ -10,7 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.core.config import settings
-from src.models.video import VideoStatus
+from src.models.video import Video, VideoStatus
 from src.services.video_processing_service import VideoProcessingService
 
 
@@ -20,30 +20,31 @@ class TestDurationValidation:
     @pytest.fixture
     def mock_video_long(self):
         """Fixture de video largo (>35:59)."""
-        video = MagicMock()
-        video.id = "test-uuid-long"
-        video.youtube_id = "long_video_id"
-        video.title = "Video de 40 minutos"
-        video.url = "https://youtube.com/watch?v=long"
-        video.duration_seconds = 2400  # 40 minutos
-        video.status = VideoStatus.PENDING
-        video.extra_metadata = {}
-        return video
+        return MagicMock(
+            spec=Video,
+            id="test-uuid-long",
+            youtube_id="long_video_id",
+            title="Video de 40 minutos",
+            url="https://youtube.com/watch?v=long",
+            duration_seconds=2400,  # 40 minutos
+            status=VideoStatus.PENDING,
+            extra_metadata={},
+        )
 
     @pytest.fixture
     def mock_video_valid(self):
         """Fixture de video válido (<=35:59)."""
-        video = MagicMock()
-        video.id = "test-uuid-valid"
-        video.youtube_id = "valid_video_id"
-        video.title = "Video de 30 minutos"
-        video.url = "https://youtube.com/watch?v=valid"
-        video.duration_seconds = 1800  # 30 minutos
-        video.status = VideoStatus.PENDING
-        video.extra_metadata = {}
-        return video
-
-    @pytest.mark.asyncio
+        return MagicMock(
+            spec=Video,
+            id="test-uuid-valid",
+            youtube_id="valid_video_id",
+            title="Video de 30 minutos",
+            url="https://youtube.com/watch?v=valid",
+            duration_seconds=1800,  # 30 minutos
+            status=VideoStatus.PENDING,
+            extra_metadata={},
+        )
+
     async def test_long_video_is_skipped(self, mock_video_long):
         """Verifica que videos >35:59 se marcan como SKIPPED."""
         # Arrange
@@ -67,7 +68,6 @@ class TestDurationValidation:
                 result.extra_metadata["max_allowed_seconds"] == settings.MAX_VIDEO_DURATION_SECONDS
             )
 
-    @pytest.mark.asyncio
     async def test_valid_video_is_processed(self, mock_video_valid):
         """Verifica que videos <=35:59 NO se marcan como SKIPPED."""
         # Arrange
@@ -94,19 +94,22 @@ class TestDurationValidation:
             # No debe tener skip_reason en metadata
             assert "skip_reason" not in (result.extra_metadata or {})
 
-    def test_format_duration_helper(self):
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            # Formato MM:SS
+            (125, "2:05"),
+            (2159, "35:59"),
+            (60, "1:00"),
+            # Formato HH:MM:SS
+            (3665, "1:01:05"),
+            (7200, "2:00:00"),
+            (3600, "1:00:00"),
+        ],
+    )
+    def test_format_duration_helper(self, seconds, expected):
         """Verifica que _format_duration() formatea correctamente."""
-        service = VideoProcessingService()
-
-        # Test MM:SS format
-        assert service._format_duration(125) == "2:05"
-        assert service._format_duration(2159) == "35:59"
-        assert service._format_duration(60) == "1:00"
-
-        # Test HH:MM:SS format
-        assert service._format_duration(3665) == "1:01:05"
-        assert service._format_duration(7200) == "2:00:00"
-        assert service._format_duration(3600) == "1:00:00"
+        assert VideoProcessingService._format_duration(seconds) == expected
 
 
 class TestVideoRepository:
@@ -2,43 +2,118 @@
 Fixtures para tests de tareas Celery.
 
 Proporciona fixtures comunes:
-- db_session: Sesión de BD para tests de tasks
+- test_engine: Engine ligado a un schema PostgreSQL propio del worker de xdist
+  (en TEST_DATABASE_URL, eliminado al terminar la sesión)
+- create_schema: Crea las tablas una sola vez por sesión de tests
+- db_connection: Conexión con transacción externa por módulo (rollback al final)
+- module_session: Sesión para datos de solo lectura compartidos por el módulo
+- db_session: Sesión de BD por test, aislada con un SAVEPOINT
 """
 
 import pytest
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 
-from src.core.database import engine
 from src.models.base import Base
+from tests.conftest import TEST_DATABASE_URL, truncate_all_tables
 
 
-@pytest.fixture(scope="function")
-def db_session():
+@pytest.fixture(scope="session")
+def test_engine(worker_id):
     """
-    Crea una sesión de BD para tests de tasks.
+    Engine cuyas conexiones usan un schema exclusivo del worker de pytest-xdist.
+
+    Con `pytest -n auto` cada worker (gw0, gw1, ...) trabaja en su propio
+    schema (test_gw0, ...), por lo que los tests en paralelo no compiten por
+    las mismas tablas. Sin xdist, worker_id es "master". El schema se crea en
+    TEST_DATABASE_URL y se elimina al terminar la sesión.
+    """
+    schema = f"test_{worker_id}"
+    engine = create_engine(TEST_DATABASE_URL, pool_pre_ping=True)
+
+    @event.listens_for(engine, "connect")
+    def set_search_path(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'SET search_path TO "{schema}"')
+        cursor.close()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+
+    yield engine
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_schema(test_engine):
+    """
+    Crea todas las tablas una vez por sesión (idempotente si ya existen).
+
+    También elimina datos residuales de ejecuciones abortadas anteriormente.
+    """
+    Base.metadata.create_all(test_engine)
+    truncate_all_tables(test_engine)
+
+
+@pytest.fixture(scope="module")
+def db_connection(test_engine):
+    """
+    Conexión dedicada por módulo con una transacción externa.
 
-    Cada test obtiene una BD limpia y aislada.
-    Usa la BD real de desarrollo (requiere PostgreSQL corriendo).
+    Todo lo escrito durante el módulo (fixtures compartidas y tests) vive
+    dentro de esta transacción y se descarta con un único rollback.
     """
-    # Crear todas las tablas (idempotente si ya existen)
-    Base.metadata.create_all(engine)
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
 
-    # Crear sesión
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestingSessionLocal()
+
+@pytest.fixture(scope="module")
+def module_session(db_connection):
+    """Sesión para fixtures de solo lectura compartidas por todo el módulo."""
+    # expire_on_commit=False: los objetos compartidos no se recargan en cada test
+    session = Session(
+        bind=db_connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield session
     finally:
-        # Rollback para deshacer cambios del test
-        session.rollback()
         session.close()
 
-        # Limpiar datos pero mantener schema
-        # Esto es más rápido y evita race conditions
-        with engine.begin() as conn:
-            for table in reversed(Base.metadata.sorted_tables):
-                conn.execute(table.delete())
 
-        # NO hacer drop_all aquí - causa race conditions entre tests
-        # Base.metadata.drop_all(engine)
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """
+    Crea una sesión de BD para tests de tasks.
+
+    Cada test abre su propio SAVEPOINT en la conexión del módulo y lo deshace
+    al terminar. Los commit() del código bajo test solo liberan el SAVEPOINT
+    interno de la sesión (dentro del del test), así que nada de lo que
+    escriben sobrevive al test; las fixtures compartidas del módulo siguen
+    intactas y no se re-insertan. Las fixtures solo necesitan flush().
+    """
+    test_savepoint = db_connection.begin_nested()
+    session = Session(
+        bind=db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    try:
+        yield session
+    finally:
+        session.close()
+        if test_savepoint.is_active:
+            test_savepoint.rollback()
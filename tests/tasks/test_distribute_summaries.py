@@ -14,7 +14,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
-from telegram.error import Forbidden
+from sqlalchemy import select
+from telegram.error import Forbidden, RetryAfter
 
 from src.models import Source, Summary, TelegramUser, Transcription, Video
 from src.tasks.distribute_summaries import (
@@ -32,23 +33,33 @@ def mock_bot():
     return bot
 
 
-@pytest.fixture
-def sample_source(db_session):
-    """Fixture para crear una fuente de prueba."""
+@pytest.fixture(autouse=True)
+def reset_task_state():
+    """Descarta la sesión y el bot cacheados en la task entre tests."""
+    distribute_summary_task._db = None
+    distribute_summary_task._bot = None
+    yield
+    distribute_summary_task._db = None
+    distribute_summary_task._bot = None
+
+
+@pytest.fixture(scope="module")
+def sample_source(module_session):
+    """Fixture para crear una fuente de prueba (compartida por el módulo)."""
     source = Source(
         url="https://youtube.com/@test_channel",
         source_type="youtube",
         name="Test Channel",
         extra_metadata={"youtube_channel_id": "UC123456"},
     )
-    db_session.add(source)
-    db_session.commit()
+    module_session.add(source)
+    module_session.flush()
     return source
 
 
-@pytest.fixture
-def sample_video(db_session, sample_source):
-    """Fixture para crear un video de prueba."""
+@pytest.fixture(scope="module")
+def sample_video(module_session, sample_source):
+    """Fixture para crear un video de prueba (compartido por el módulo)."""
     video = Video(
         url="https://youtube.com/watch?v=test123",
         youtube_id="test123",
@@ -56,14 +67,14 @@ def sample_video(db_session, sample_source):
         source_id=sample_source.id,
         duration_seconds=300,
     )
-    db_session.add(video)
-    db_session.commit()
+    module_session.add(video)
+    module_session.flush()
     return video
 
 
-@pytest.fixture
-def sample_transcription(db_session, sample_video):
-    """Fixture para crear una transcripción de prueba."""
+@pytest.fixture(scope="module")
+def sample_transcription(module_session, sample_video):
+    """Fixture para crear una transcripción de prueba (compartida por el módulo)."""
     transcription = Transcription(
         video_id=sample_video.id,
         text="This is a test transcription about AI and programming.",
@@ -71,8 +82,8 @@ def sample_transcription(db_session, sample_video):
         model_used="whisper-base",
         duration_seconds=300,
     )
-    db_session.add(transcription)
-    db_session.commit()
+    module_session.add(transcription)
+    module_session.flush()
     return transcription
 
 
@@ -89,31 +100,29 @@ def sample_summary(db_session, sample_transcription):
         sent_to_telegram=False,
     )
     db_session.add(summary)
-    db_session.commit()
+    db_session.flush()
     return summary
 
 
 @pytest.fixture
 def subscribed_users(db_session, sample_source):
     """Fixture para crear usuarios suscritos."""
-    users = []
-    for i in range(3):
-        user = TelegramUser(
+    # sample_source pertenece a module_session: usar la instancia de esta sesión
+    source = db_session.get(Source, sample_source.id)
+
+    users = [
+        TelegramUser(
             telegram_id=123456789 + i,
             username=f"user{i}",
             first_name=f"Test User {i}",
             is_active=True,
             bot_blocked=False,
+            sources=[source],  # Suscribir al source
         )
-        db_session.add(user)
-        db_session.flush()
-
-        # Suscribir al source
-        user.sources.append(sample_source)
-
-        users.append(user)
-
-    db_session.commit()
+        for i in range(3)
+    ]
+    db_session.add_all(users)
+    db_session.flush()
     return users
 
 
@@ -241,15 +250,22 @@ def test_handle_user_blocked_bot(
     assert result["status"] == "completed"
     assert result["messages_sent"] == 2  # Solo 2 usuarios recibieron
 
+    # Recargar los 3 usuarios en un único SELECT ... WHERE id IN (...)
+    users_by_id = {
+        user.id: user
+        for user in db_session.execute(
+            select(TelegramUser)
+            .where(TelegramUser.id.in_([u.id for u in subscribed_users]))
+            .execution_options(populate_existing=True)
+        ).scalars()
+    }
+
     # Validar que el primer usuario fue marcado como bot_blocked
-    db_session.refresh(subscribed_users[0])
-    assert subscribed_users[0].bot_blocked is True
+    assert users_by_id[subscribed_users[0].id].bot_blocked is True
 
     # Validar que otros usuarios NO fueron bloqueados
-    db_session.refresh(subscribed_users[1])
-    db_session.refresh(subscribed_users[2])
-    assert subscribed_users[1].bot_blocked is False
-    assert subscribed_users[2].bot_blocked is False
+    assert users_by_id[subscribed_users[1].id].bot_blocked is False
+    assert users_by_id[subscribed_users[2].id].bot_blocked is False
 
 
 @patch("src.tasks.distribute_summaries.Bot")
@@ -312,8 +328,6 @@ def test_telegram_rate_limit_retry(
     mock_bot_class.return_value = mock_bot
 
     # Mock send_message: lanza error de rate limit
-    from telegram.error import RetryAfter
-
     mock_bot.send_message = AsyncMock(side_effect=RetryAfter(retry_after=30))
 
     # Ejecutar tarea (debe lanzar excepción para retry)
@@ -321,6 +335,52 @@ def test_telegram_rate_limit_retry(
         distribute_summary_task(str(sample_summary.id))
 
 
+@patch("src.tasks.distribute_summaries.Bot")
+@patch("src.tasks.distribute_summaries.SessionLocal")
+def test_rate_limit_keeps_blocked_users(
+    mock_session_local,
+    mock_bot_class,
+    db_session,
+    sample_summary,
+    subscribed_users,
+):
+    """
+    Test: Un rate limit no pierde los usuarios que bloquearon el bot.
+
+    Verifica que:
+    - RetryAfter se propaga para retry automático
+    - El usuario con error Forbidden queda marcado como bot_blocked = True
+    - El resumen sigue pendiente de envío
+    """
+    # Configurar mocks
+    mock_session_local.return_value = db_session
+    mock_bot = MagicMock()
+    mock_bot_class.return_value = mock_bot
+
+    # Mock send_message: primer usuario bloqueó el bot, segundo rate limit, tercero OK
+    mock_message = MagicMock()
+    mock_message.message_id = 999
+
+    async def mock_send(chat_id, **kwargs):
+        if chat_id == subscribed_users[0].telegram_id:
+            raise Forbidden("Bot was blocked by the user")
+        if chat_id == subscribed_users[1].telegram_id:
+            raise RetryAfter(retry_after=30)
+        return mock_message
+
+    mock_bot.send_message = AsyncMock(side_effect=mock_send)
+
+    # Ejecutar tarea (debe lanzar excepción para retry)
+    with pytest.raises(RetryAfter):
+        distribute_summary_task(str(sample_summary.id))
+
+    # Validar que el bloqueo se persistió y el resumen no se marcó como enviado
+    db_session.refresh(subscribed_users[0])
+    db_session.refresh(sample_summary)
+    assert subscribed_users[0].bot_blocked is True
+    assert sample_summary.sent_to_telegram is False
+
+
 @patch("src.tasks.distribute_summaries.SessionLocal")
 def test_summary_not_found(mock_session_local, db_session):
     """
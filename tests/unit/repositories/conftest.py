@@ -4,19 +4,30 @@ Fixtures compartidos para tests de repositories.
 Este módulo proporciona fixtures reutilizables para tests de repositories,
 incluyendo:
 - Base de datos PostgreSQL en Docker (compatible con tipos JSONB, ARRAY)
-- Sesiones de BD con rollback automático y cleanup
+- Sesiones de BD aisladas con SAVEPOINT y rollback automático
 - Datos de ejemplo (sources, videos, transcriptions, summaries, users)
 
 IMPORTANTE: Requiere PostgreSQL corriendo en Docker.
 Ejecutar antes de los tests: docker-compose up -d postgres
+
+Las tablas de tests se crean UNLOGGED (sin WAL). Para ir más allá, el
+servicio postgres-test de docker-compose corre en tmpfs y sin durabilidad
+(fsync=off, synchronous_commit=off, full_page_writes=off):
+    docker-compose --profile test up -d postgres-test
 """
 
+import io
 import os
+from datetime import UTC, datetime
+from functools import cache
+from types import MappingProxyType, SimpleNamespace
+from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, insert, inspect, make_url, select, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from src.models import Base, Source, Summary, TelegramUser, Transcription, User, Video
 from src.models.video import VideoStatus
@@ -35,116 +46,500 @@ TEST_DATABASE_URL = os.getenv(
 )
 
 
+# Engines creados por _make_engine, para liberarlos al final de la sesión
+_ENGINES: list[Engine] = []
+
+
 # ==================== FIXTURES DE BASE DE DATOS ====================
 
 
+def _create_schema(engine) -> None:
+    """
+    Crea todas las tablas e índices con un único script DDL.
+
+    Base.metadata.create_all() emite una sentencia (y una ida y vuelta) por
+    tabla, índice y comentario. Aquí se compila el DDL una vez y se ejecuta
+    de golpe. Los COMMENT ON de columnas se omiten: no afectan a los tests.
+
+    En PostgreSQL las tablas pasan a UNLOGGED en el mismo script: los datos
+    de tests son efímeros y no tiene sentido escribir WAL por cada
+    INSERT/UPDATE. Se recorren de dependientes a referenciadas, porque una
+    tabla con WAL no puede apuntar con una FK a una UNLOGGED.
+    """
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table, if_not_exists=True).compile(engine)))
+        statements.extend(
+            str(CreateIndex(index, if_not_exists=True).compile(engine)) for index in table.indexes
+        )
+
+    if engine.dialect.name == "postgresql":
+        statements.extend(
+            f'ALTER TABLE "{table.name}" SET UNLOGGED'
+            for table in reversed(Base.metadata.sorted_tables)
+        )
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(";\n".join(statements))
+
+
+def _worker_database_url(database_url: str) -> str:
+    """
+    URL de la BD de tests propia del worker de pytest-xdist.
+
+    Con xdist (PYTEST_XDIST_WORKER=gw0, gw1, ...) cada worker usa su propia
+    BD, "<bd>_gw0", "<bd>_gw1", ..., para que los tests no compitan por las
+    mismas tablas. Sin xdist se usa la URL tal cual.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return database_url
+
+    url = make_url(database_url)
+    return url.set(database=f"{url.database}_{worker}").render_as_string(hide_password=False)
+
+
+def _provision_database(database_url: str) -> None:
+    """
+    Crea la BD de tests del worker de xdist si todavía no existe.
+
+    Se ejecuta contra la BD de mantenimiento 'postgres' en AUTOCOMMIT
+    (CREATE DATABASE no admite transacciones), bajo un advisory lock: dos
+    CREATE DATABASE simultáneos fallan al copiar a la vez template1.
+    """
+    url = make_url(database_url)
+    admin_engine = create_engine(
+        url.set(database="postgres"), poolclass=NullPool, isolation_level="AUTOCOMMIT"
+    )
+    exists_sql = text("SELECT 1 FROM pg_database WHERE datname = :name")
+    lock_key = {"key": "test_db_provision"}
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), lock_key)
+            try:
+                if not conn.scalar(exists_sql, {"name": url.database}):
+                    conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), lock_key)
+    finally:
+        admin_engine.dispose()
+
+
+@cache
+def _make_engine(frozen_config: frozenset) -> Engine:
+    """
+    Crea (o reutiliza) un engine por configuración única.
+
+    La clave es un frozenset de los parámetros de create_engine, así que
+    fixtures o tests parametrizados con la misma URL y opciones comparten
+    un único engine. Se liberan todos en pytest_sessionfinish.
+
+    Args:
+        frozen_config: frozenset(config.items()) con "url" y kwargs de create_engine.
+    """
+    config = dict(frozen_config)
+    engine = create_engine(config.pop("url"), **config)
+    _ENGINES.append(engine)  # cache no expone sus valores
+    return engine
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Libera los engines memoizados por _make_engine al terminar la sesión."""
+    for engine in _ENGINES:
+        engine.dispose()
+    _ENGINES.clear()
+    _make_engine.cache_clear()
+
+
 @pytest.fixture(scope="session")
-def db_engine_session():
+def db_engine_session(request):
     """
     Engine de PostgreSQL compartido para toda la sesión de tests.
 
     Scope 'session' significa que se crea UNA VEZ para todos los tests.
     Esto es más eficiente que crear un engine por cada test.
 
-    Usa NullPool para evitar problemas de conexiones en tests paralelos.
+    Con pytest-xdist, cada worker usa su propia BD ("<bd>_gwN"), así que
+    el engine puede usar un QueuePool normal: nadie más comparte las tablas.
+
+    Las tablas se crean solo si no existen, y se eliminan al final
+    únicamente con --clean-db.
     """
-    engine = create_engine(
-        TEST_DATABASE_URL,
-        poolclass=NullPool,  # No usar pool en tests
-        echo=False,  # Cambiar a True para debug SQL
+    database_url = _worker_database_url(TEST_DATABASE_URL)
+    if database_url != TEST_DATABASE_URL:
+        _provision_database(database_url)
+
+    engine = _make_engine(
+        frozenset(
+            {
+                "url": database_url,
+                # QueuePool: el connection.close() de cada db_session devuelve
+                # la conexión al pool, sin handshake por test. Un worker usa
+                # como mucho 3 a la vez (clase, test y ro_session); sin
+                # pool_pre_ping, que añadiría un SELECT 1 por checkout
+                "pool_size": 5,
+                "max_overflow": 0,
+                "pool_recycle": 3600,
+                # Caché de SQL compilado (default 500): el engine vive toda la
+                # sesión y la suite usa más sentencias distintas que eso
+                # (repositories x opciones de carga x paginación)
+                "query_cache_size": 1200,
+                "echo": False,  # Cambiar a True para debug SQL
+            }.items()
+        )
     )
 
-    # Crear todas las tablas
-    Base.metadata.create_all(engine)
+    # Crear las tablas solo si no existen ya de una ejecución anterior
+    if not inspect(engine).has_table(Source.__tablename__):
+        _create_schema(engine)
 
     yield engine
 
-    # Cleanup: eliminar todas las tablas al finalizar sesión
-    Base.metadata.drop_all(engine)
-    engine.dispose()
+    # Cleanup: las tablas se conservan salvo con --clean-db
+    # (el dispose del engine lo hace pytest_sessionfinish)
+    if request.config.getoption("--clean-db"):
+        Base.metadata.drop_all(engine)
 
 
-@pytest.fixture(scope="function")
-def db_engine(db_engine_session):
+@pytest.fixture(scope="session")
+def session_factory() -> sessionmaker:
+    """
+    Factoría de sesiones construida UNA VEZ para toda la sesión de tests.
+
+    sessionmaker() crea una subclase de Session en cada llamada, así que se
+    reutiliza la misma y cada test solo le pasa su conexión con bind=.
+
+    expire_on_commit=False: tras el commit() (liberar el SAVEPOINT) los
+    objetos no se expiran. Los UUID se generan en cliente y los
+    server_default (created_at...) vuelven en el RETURNING del INSERT, así
+    que las fixtures no necesitan refresh() tras el commit.
+
+    autoflush=False: las fixtures y los repositories ya hacen flush()/commit()
+    explícitos, así que cada query no necesita recorrer la sesión buscando
+    objetos pendientes.
     """
-    Fixture que proporciona el engine a cada test.
+    return sessionmaker(
+        join_transaction_mode="create_savepoint", expire_on_commit=False, autoflush=False
+    )
 
-    Simplemente retorna el engine de sesión, pero con scope 'function'
-    para que cada test pueda usarlo independientemente.
+
+@pytest.fixture(scope="class")
+def class_connection(db_engine_session):
     """
-    return db_engine_session
+    Conexión con transacción externa compartida por los tests de una clase.
+
+    La usan las fixtures de datos de solo lectura con scope 'class'
+    (shared_videos, shared_summaries): se insertan una vez y se deshacen al
+    terminar la clase.
+    """
+    connection = db_engine_session.connect()
+    transaction = connection.begin()
+
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def db_session(db_engine) -> Session:
+def db_session(request, db_engine_session, session_factory) -> Session:
     """
-    Sesión de BD con rollback automático y limpieza de datos.
+    Sesión de BD aislada con una transacción que se deshace al terminar.
 
     Cada test obtiene una sesión limpia:
-    1. Limpia todas las tablas antes del test
-    2. Ejecuta el test
-    3. Hace rollback y cierra la sesión
+    1. Abre una conexión con una transacción externa
+    2. La sesión trabaja dentro de un SAVEPOINT: los commit() del test
+       y de los repositories solo liberan el SAVEPOINT (y se abre otro)
+    3. Al terminar, rollback de la transacción externa: nada llega a
+       confirmarse en la BD, así que no hace falta limpiar tablas
 
     Esto asegura aislamiento total entre tests.
+
+    Si el test usa datos de clase (class_connection), la sesión se une a esa
+    conexión: ve las filas compartidas y al cerrarse deshace solo su
+    SAVEPOINT, sin tocar la transacción de la clase.
     """
-    SessionLocal = sessionmaker(bind=db_engine)
-    session = SessionLocal()
+    if "class_connection" in request.fixturenames:
+        session = session_factory(bind=request.getfixturevalue("class_connection"))
+        try:
+            yield session
+        finally:
+            session.close()
+        return
+
+    connection = db_engine_session.connect()
+    transaction = connection.begin()
+
+    session = session_factory(bind=connection)
 
-    # Limpiar todas las tablas antes del test
-    # Orden importante: eliminar primero tablas con FK
     try:
-        session.execute(
-            text(
-                "TRUNCATE TABLE summaries, transcriptions, videos, sources, telegram_users, users CASCADE"
-            )
-        )
-        session.commit()
-    except Exception:
-        session.rollback()
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
 
+
+@pytest.fixture(scope="session")
+def _ro_session_shared(db_engine_session) -> Session:
+    """Instancia de Session reutilizada por ro_session durante toda la ejecución."""
+    session = Session(db_engine_session)
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
+@pytest.fixture
+def ro_session(_ro_session_shared) -> Session:
+    """
+    Sesión de solo lectura compartida por toda la ejecución.
+
+    Sin conexión ni transacción externa por test: para tests que solo leen
+    y no dependen de filas creadas por fixtures (esas viven en transacciones
+    sin confirmar de otra conexión y aquí no se ven). Nunca escribir con ella.
+
+    Tras cada test se hace rollback(): termina la transacción implícita y
+    devuelve la conexión al pool, en lugar de dejarla "idle in transaction"
+    (con sus locks) bloqueando TRUNCATE/DDL posteriores en la misma BD.
+    """
+    try:
+        yield _ro_session_shared
+    finally:
+        _ro_session_shared.rollback()
+
+
+@pytest.fixture
+def existing_ids(db_session):
+    """
+    Helper que devuelve cuáles de los IDs dados existen, en una sola query.
+
+    Uso:
+        def test_delete_many(existing_ids, multiple_sources):
+            assert existing_ids(Source, [s.id for s in multiple_sources]) == set()
+    """
+
+    def _existing_ids(model: type, entity_ids) -> set:
+        ids = list(entity_ids)
+        if not ids:
+            return set()
+        return set(db_session.scalars(select(model.id).where(model.id.in_(ids))))
+
+    return _existing_ids
+
+
+# ==================== SNAPSHOT DE DATOS DE SOLO LECTURA ====================
+
+
+_SEED_TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="session")
+def session_seed() -> SimpleNamespace:
+    """
+    Snapshot inmutable de las filas canónicas de solo lectura.
+
+    Se construye UNA VEZ por sesión (incluidos los UUID, generados en
+    cliente; User usa un id entero autoincremental, así que sus filas no
+    lo fijan), así que las fixtures que lo usan solo hacen un INSERT + flush
+    dentro del SAVEPOINT del test: sin COMMIT ni refresh, y sin dejar filas
+    confirmadas que alteren los conteos de otros tests.
+
+    Returns:
+        Namespace con un mapping de columnas (de solo lectura) por fila.
+    """
+    source_id = uuid4()
+    return SimpleNamespace(
+        source=MappingProxyType(
+            {
+                "id": source_id,
+                "name": "Test Channel",
+                "source_type": "youtube",
+                "url": "https://youtube.com/@testchannel",
+                "active": True,
+            }
+        ),
+        video=MappingProxyType(
+            {
+                "id": uuid4(),
+                "url": "https://youtube.com/watch?v=test123",
+                "youtube_id": "test123",
+                "title": "Test Video Title",
+                "duration_seconds": 300,
+                "source_id": source_id,
+                "status": VideoStatus.PENDING,
+            }
+        ),
+        inactive_source=MappingProxyType(
+            {
+                "id": uuid4(),
+                "name": "Inactive Channel",
+                "source_type": "youtube",
+                "url": "https://youtube.com/@inactive",
+                "active": False,
+            }
+        ),
+        admin_user=MappingProxyType(
+            {
+                "username": "admin",
+                "email": "admin@test.com",
+                "hashed_password": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5NU8KQDpTMWBq",  # "password123"
+                "role": "admin",
+                # Timestamps fijos en el pasado: NOW() de PostgreSQL es la hora
+                # de inicio de la transacción, así que un UPDATE dentro del
+                # mismo test dejaría updated_at == created_at
+                "created_at": _SEED_TIMESTAMP,
+                "updated_at": _SEED_TIMESTAMP,
+            }
+        ),
+        regular_user=MappingProxyType(
+            {
+                "username": "user",
+                "email": "user@test.com",
+                "hashed_password": "$2b$12$hashed_password",
+                "role": "user",
+            }
+        ),
+        telegram_user=MappingProxyType(
+            {
+                "id": uuid4(),
+                "telegram_id": 123456789,
+                "username": "testuser",
+                "first_name": "Test",
+                "last_name": "User",
+                "is_active": True,
+                "language_code": "es",
+            }
+        ),
+        inactive_telegram_user=MappingProxyType(
+            {
+                "id": uuid4(),
+                "telegram_id": 987654321,
+                "username": "inactive",
+                "is_active": False,
+                "bot_blocked": True,
+            }
+        ),
+    )
+
+
+def _insert_seed(db_session: Session, model: type, row: MappingProxyType):
+    """Inserta una fila del snapshot en la transacción del test (sin commit)."""
+    instance = model(**row)
+    db_session.add(instance)
+    db_session.flush()
+    return instance
+
+
+def _copy_field(value) -> str:
+    """Formatea un valor ya procesado por el tipo de columna para COPY (texto)."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, list | tuple):
+        # Literal de array de PostgreSQL: {"a","b"}
+        items = (str(item).replace("\\", "\\\\").replace('"', '\\"') for item in value)
+        value = "{" + ",".join(f'"{item}"' for item in items) + "}"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_insert(db_session: Session, model: type, rows: list[dict]) -> list:
+    """
+    Carga filas con COPY ... FROM STDIN y devuelve las instancias ORM.
+
+    COPY es la vía de carga masiva más rápida de PostgreSQL: una sola ida y
+    vuelta sin importar el número de filas. Como COPY no aplica los default
+    de Python (id uuid4, status, model_used...), se completan aquí antes de
+    serializar; los server_default (created_at...) sí los aplica PostgreSQL.
+
+    Se ejecuta sobre la conexión de la sesión, así que las filas quedan
+    dentro de la transacción del test. Después un único SELECT devuelve las
+    instancias en el mismo orden que rows.
+
+    Args:
+        db_session: Sesión del test.
+        model: Clase ORM destino.
+        rows: Diccionarios con los valores por nombre de atributo.
+
+    Returns:
+        Instancias de model en el orden de rows.
+    """
+    mapper = inspect(model)
+    dialect = db_session.get_bind().dialect
+
+    prepared = []
+    for row in rows:
+        values = dict(row)
+        for attr in mapper.column_attrs:
+            default = attr.columns[0].default
+            if attr.key not in values and default is not None:
+                values[attr.key] = default.arg(None) if default.is_callable else default.arg
+        prepared.append(values)
+
+    keys = list(prepared[0])
+    columns = [mapper.column_attrs[key].columns[0] for key in keys]
+    processors = [column.type.bind_processor(dialect) for column in columns]
+
+    buffer = io.StringIO()
+    for values in prepared:
+        fields = []
+        for key, process in zip(keys, processors, strict=True):
+            value = values[key]
+            if process is not None and value is not None:
+                value = process(value)
+            fields.append(_copy_field(value))
+        buffer.write("\t".join(fields) + "\n")
+    buffer.seek(0)
+
+    column_list = ", ".join(f'"{column.name}"' for column in columns)
+    with db_session.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY "{mapper.local_table.name}" ({column_list}) FROM STDIN', buffer)
+
+    ids = [values["id"] for values in prepared]
+    loaded = {obj.id: obj for obj in db_session.scalars(select(model).where(model.id.in_(ids)))}
+    return [loaded[obj_id] for obj_id in ids]
+
+
 # ==================== FIXTURES DE DATOS - SOURCES ====================
 
+# Las fixtures de datos son de scope 'function' a propósito. Con un grafo
+# compartido por módulo (sample_source -> video -> transcription -> summary)
+# sus filas serían visibles en todos los tests del módulo y romperían los
+# que cuentan filas (list_all, get_active_sources, "BD vacía"...); además
+# los tests pasan estas instancias a repositories sobre db_session, y una
+# instancia no puede pertenecer a dos sesiones. El coste por test ya es
+# bajo: INSERT + flush dentro del SAVEPOINT, sin COMMIT ni refresh.
+#
+# Los datos de solo lectura sí se comparten por clase (shared_videos,
+# shared_summaries, sobre class_connection). Cualquier fixture de ese tipo
+# debe usar claves únicas propias: si coincidieran con las de sample_source
+# & co., el INSERT del test quedaría bloqueado por la fila sin confirmar de
+# la clase.
+
 
 @pytest.fixture
-def sample_source(db_session) -> Source:
+def sample_source(db_session, session_seed) -> Source:
     """
     Fuente de YouTube de ejemplo.
 
     Returns:
         Source activa con metadata básica.
     """
-    source = Source(
-        name="Test Channel",
-        source_type="youtube",
-        url="https://youtube.com/@testchannel",
-        active=True,
-    )
-    db_session.add(source)
-    db_session.commit()
-    db_session.refresh(source)
-    return source
+    return _insert_seed(db_session, Source, session_seed.source)
 
 
 @pytest.fixture
-def inactive_source(db_session) -> Source:
+def inactive_source(db_session, session_seed) -> Source:
     """Fuente inactiva para tests de filtrado."""
-    source = Source(
-        name="Inactive Channel",
-        source_type="youtube",
-        url="https://youtube.com/@inactive",
-        active=False,
-    )
-    db_session.add(source)
-    db_session.commit()
-    db_session.refresh(source)
-    return source
+    return _insert_seed(db_session, Source, session_seed.inactive_source)
 
 
 @pytest.fixture
@@ -155,45 +550,33 @@ def multiple_sources(db_session) -> list[Source]:
     Returns:
         Lista de 5 sources (3 activas, 2 inactivas).
     """
-    sources = [
-        Source(
-            name=f"Channel {i}",
-            source_type="youtube",
-            url=f"https://youtube.com/@channel{i}",
-            active=(i % 3 != 0),  # Cada 3era está inactiva
-        )
-        for i in range(5)
-    ]
-    db_session.add_all(sources)
-    db_session.commit()
-    for source in sources:
-        db_session.refresh(source)
-    return sources
+    # Un único INSERT ... RETURNING que devuelve las instancias ya hidratadas
+    return db_session.scalars(
+        insert(Source).returning(Source, sort_by_parameter_order=True),
+        [
+            {
+                "name": f"Channel {i}",
+                "source_type": "youtube",
+                "url": f"https://youtube.com/@channel{i}",
+                "active": (i % 3 != 0),  # Cada 3era está inactiva
+            }
+            for i in range(5)
+        ],
+    ).all()
 
 
 # ==================== FIXTURES DE DATOS - VIDEOS ====================
 
 
 @pytest.fixture
-def sample_video(db_session, sample_source) -> Video:
+def sample_video(db_session, session_seed, sample_source) -> Video:
     """
     Video de ejemplo con metadata completa.
 
     Returns:
-        Video en estado PENDING listo para procesar.
+        Video en estado PENDING listo para procesar (de sample_source).
     """
-    video = Video(
-        url="https://youtube.com/watch?v=test123",
-        youtube_id="test123",
-        title="Test Video Title",
-        duration_seconds=300,
-        source_id=sample_source.id,
-        status=VideoStatus.PENDING,
-    )
-    db_session.add(video)
-    db_session.commit()
-    db_session.refresh(video)
-    return video
+    return _insert_seed(db_session, Video, session_seed.video)
 
 
 @pytest.fixture
@@ -208,8 +591,7 @@ def completed_video(db_session, sample_source) -> Video:
         status=VideoStatus.COMPLETED,
     )
     db_session.add(video)
-    db_session.commit()
-    db_session.refresh(video)
+    db_session.flush()
     return video
 
 
@@ -225,8 +607,7 @@ def failed_video(db_session, sample_source) -> Video:
         status=VideoStatus.FAILED,
     )
     db_session.add(video)
-    db_session.commit()
-    db_session.refresh(video)
+    db_session.flush()
     return video
 
 
@@ -238,6 +619,11 @@ def multiple_videos(db_session, sample_source) -> list[Video]:
     Returns:
         Lista de 10 videos con estados variados.
     """
+    return _seed_multiple_videos(db_session, sample_source.id)
+
+
+def _seed_multiple_videos(session: Session, source_id, prefix: str = "video") -> list[Video]:
+    """Inserta (COPY) los 10 videos de multiple_videos para source_id (youtube_id "<prefix>N")."""
     statuses = [
         VideoStatus.PENDING,
         VideoStatus.DOWNLOADING,
@@ -251,23 +637,21 @@ def multiple_videos(db_session, sample_source) -> list[Video]:
         VideoStatus.FAILED,
     ]
 
-    videos = [
-        Video(
-            url=f"https://youtube.com/watch?v=video{i}",
-            youtube_id=f"video{i}",
-            title=f"Video {i}",
-            duration_seconds=100 + (i * 50),
-            source_id=sample_source.id,
-            status=statuses[i],
-        )
-        for i in range(10)
-    ]
-
-    db_session.add_all(videos)
-    db_session.commit()
-    for video in videos:
-        db_session.refresh(video)
-    return videos
+    return _copy_insert(
+        session,
+        Video,
+        [
+            {
+                "url": f"https://youtube.com/watch?v={prefix}{i}",
+                "youtube_id": f"{prefix}{i}",
+                "title": f"Video {i}",
+                "duration_seconds": 100 + (i * 50),
+                "source_id": source_id,
+                "status": statuses[i],
+            }
+            for i in range(10)
+        ],
+    )
 
 
 # ==================== FIXTURES DE DATOS - TRANSCRIPTIONS ====================
@@ -288,8 +672,7 @@ def sample_transcription(db_session, sample_video) -> Transcription:
         duration_seconds=300,
     )
     db_session.add(transcription)
-    db_session.commit()
-    db_session.refresh(transcription)
+    db_session.flush()
     return transcription
 
 
@@ -303,8 +686,7 @@ def english_transcription(db_session, completed_video) -> Transcription:
         duration_seconds=600,
     )
     db_session.add(transcription)
-    db_session.commit()
-    db_session.refresh(transcription)
+    db_session.flush()
     return transcription
 
 
@@ -325,8 +707,7 @@ def sample_summary(db_session, sample_transcription) -> Summary:
         keywords=["Python", "pytest", "testing", "mocking"],
     )
     db_session.add(summary)
-    db_session.commit()
-    db_session.refresh(summary)
+    db_session.flush()
     return summary
 
 
@@ -338,21 +719,25 @@ def multiple_summaries(db_session, multiple_videos) -> list[Summary]:
     Returns:
         Lista de 5 summaries con diferentes keywords.
     """
-    # Crear transcripciones primero
-    transcriptions = []
-    for i, video in enumerate(multiple_videos[:5]):
-        trans = Transcription(
-            video_id=video.id,
-            text=f"Transcription {i}",
-            language="es",
-            duration_seconds=video.duration_seconds,
-        )
-        db_session.add(trans)
-        transcriptions.append(trans)
-
-    db_session.commit()
-    for trans in transcriptions:
-        db_session.refresh(trans)
+    return _seed_multiple_summaries(db_session, multiple_videos)
+
+
+def _seed_multiple_summaries(session: Session, videos: list[Video]) -> list[Summary]:
+    """Inserta (COPY) transcripciones y resúmenes para los 5 primeros videos."""
+    # Crear transcripciones primero (un COPY)
+    transcriptions = _copy_insert(
+        session,
+        Transcription,
+        [
+            {
+                "video_id": video.id,
+                "text": f"Transcription {i}",
+                "language": "es",
+                "duration_seconds": video.duration_seconds,
+            }
+            for i, video in enumerate(videos[:5])
+        ],
+    )
 
     # Crear resúmenes con diferentes temas
     summaries_data = [
@@ -363,90 +748,109 @@ def multiple_summaries(db_session, multiple_videos) -> list[Summary]:
         ("Testing automatizado con pytest", ["pytest", "testing", "Python", "QA"]),
     ]
 
-    summaries = []
-    for i, (summary_text, keywords) in enumerate(summaries_data):
-        summary = Summary(
-            transcription_id=transcriptions[i].id, summary_text=summary_text, keywords=keywords
-        )
-        db_session.add(summary)
-        summaries.append(summary)
+    return _copy_insert(
+        session,
+        Summary,
+        [
+            {
+                "transcription_id": transcriptions[i].id,
+                "summary_text": summary_text,
+                "keywords": keywords,
+            }
+            for i, (summary_text, keywords) in enumerate(summaries_data)
+        ],
+    )
+
+
+@pytest.fixture(scope="class")
+def class_session(class_connection, session_factory) -> Session:
+    """Sesión sobre class_connection para sembrar los datos compartidos de la clase."""
+    session = session_factory(bind=class_connection)
+    try:
+        yield session
+    finally:
+        session.close()
 
-    db_session.commit()
-    for summary in summaries:
-        db_session.refresh(summary)
-    return summaries
+
+@pytest.fixture(scope="class")
+def shared_videos(class_session) -> list[Video]:
+    """
+    Los mismos 10 videos que multiple_videos, creados UNA VEZ por clase.
+
+    Para tests de solo lectura (filtros por estado, estadísticas...). Las
+    filas viven en la transacción de class_connection, y db_session se une
+    a esa conexión en los tests que usan esta fixture: cada test las ve, y
+    lo que escriba se deshace con su propio SAVEPOINT.
+
+    Returns:
+        Lista de 10 videos (instancias de la sesión de clase: solo leer ids
+        y columnas; para relaciones, consultar desde db_session).
+    """
+    # Claves únicas (url, youtube_id) distintas de las fixtures de función:
+    # las filas de clase siguen sin confirmar mientras dura la clase, y un
+    # INSERT con la misma clave desde otra conexión esperaría a ese lock
+    source = Source(
+        name="Shared Channel",
+        source_type="youtube",
+        url="https://youtube.com/@sharedchannel",
+        active=True,
+    )
+    class_session.add(source)
+    class_session.flush()
+
+    return _seed_multiple_videos(class_session, source.id, prefix="shared_video")
+
+
+@pytest.fixture(scope="class")
+def shared_summaries(class_session, shared_videos) -> list[Summary]:
+    """
+    Los mismos 5 resúmenes que multiple_summaries, creados UNA VEZ por clase.
+
+    Para tests de solo lectura (listados, búsquedas, paginación), sobre los
+    videos de shared_videos (ver allí cómo se comparten las filas).
+
+    Returns:
+        Lista de 5 summaries (instancias de la sesión de clase: solo leer ids
+        y columnas; para relaciones, consultar desde db_session).
+    """
+    return _seed_multiple_summaries(class_session, shared_videos)
 
 
 # ==================== FIXTURES DE DATOS - USERS ====================
 
 
 @pytest.fixture
-def sample_user(db_session) -> User:
+def sample_user(db_session, session_seed) -> User:
     """
     Usuario admin de ejemplo.
 
     Returns:
         User con rol admin y password hasheado.
     """
-    user = User(
-        username="admin",
-        email="admin@test.com",
-        hashed_password="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5NU8KQDpTMWBq",  # "password123"
-        role="admin",
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    return _insert_seed(db_session, User, session_seed.admin_user)
 
 
 @pytest.fixture
-def regular_user(db_session) -> User:
+def regular_user(db_session, session_seed) -> User:
     """Usuario con rol normal (no admin)."""
-    user = User(
-        username="user",
-        email="user@test.com",
-        hashed_password="$2b$12$hashed_password",
-        role="user",
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    return _insert_seed(db_session, User, session_seed.regular_user)
 
 
 @pytest.fixture
-def sample_telegram_user(db_session) -> TelegramUser:
+def sample_telegram_user(db_session, session_seed) -> TelegramUser:
     """
     Usuario de Telegram de ejemplo.
 
     Returns:
         TelegramUser activo listo para recibir notificaciones.
     """
-    user = TelegramUser(
-        telegram_id=123456789,
-        username="testuser",
-        first_name="Test",
-        last_name="User",
-        is_active=True,
-        language_code="es",
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    return _insert_seed(db_session, TelegramUser, session_seed.telegram_user)
 
 
 @pytest.fixture
-def inactive_telegram_user(db_session) -> TelegramUser:
+def inactive_telegram_user(db_session, session_seed) -> TelegramUser:
     """Usuario de Telegram inactivo (bot bloqueado)."""
-    user = TelegramUser(
-        telegram_id=987654321, username="inactive", is_active=False, bot_blocked=True
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    return _insert_seed(db_session, TelegramUser, session_seed.inactive_telegram_user)
 
 
 @pytest.fixture
@@ -455,6 +859,5 @@ def telegram_user_with_subscriptions(db_session, sample_source) -> TelegramUser:
     user = TelegramUser(telegram_id=111222333, username="subscribed_user", is_active=True)
     user.sources.append(sample_source)
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    db_session.flush()
     return user
@@ -17,14 +17,15 @@ from src.repositories.exceptions import NotFoundError
 from src.repositories.source_repository import SourceRepository
 
 
+@pytest.fixture
+def repository(db_session):
+    """Fixture que crea una instancia del repository (compartida por todas las clases)."""
+    return SourceRepository(db_session)
+
+
 class TestSourceRepositoryCRUD:
     """Tests para operaciones CRUD básicas."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que crea una instancia del repository."""
-        return SourceRepository(db_session)
-
     def test_create_source(self, repository, db_session):
         """Test 1: Crear fuente exitosamente"""
         # Arrange
@@ -37,7 +38,7 @@ class TestSourceRepositoryCRUD:
 
         # Act
         created = repository.create(source)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert created.id is not None
@@ -66,35 +67,23 @@ class TestSourceRepositoryCRUD:
         with pytest.raises(NotFoundError):
             repository.get_by_id(non_existent_id)
 
-    def test_list_all_sources(self, repository, multiple_sources):
-        """Test 4: Listar todas las fuentes"""
+    @pytest.mark.parametrize(
+        "limit,offset,expected",
+        [(100, 0, 5), (2, 0, 2), (100, 2, 3)],
+        ids=["all", "limit", "offset"],
+    )
+    def test_list_all(self, repository, multiple_sources, limit, offset, expected):
+        """Test 4-6: Listar todas las fuentes, con límite y con offset"""
         # Act
-        sources = repository.list_all()
+        sources = repository.list_all(limit=limit, offset=offset)
 
         # Assert
-        assert len(sources) == 5
+        assert len(sources) == expected
         assert all(isinstance(s, Source) for s in sources)
-
-    def test_list_all_with_limit(self, repository, multiple_sources):
-        """Test 5: Listar con límite"""
-        # Act
-        sources = repository.list_all(limit=2)
-
-        # Assert
-        assert len(sources) == 2
-
-    def test_list_all_with_offset(self, repository, multiple_sources):
-        """Test 6: Listar con offset"""
-        # Act
-        all_sources = repository.list_all()
-        offset_sources = repository.list_all(offset=2)
-
-        # Assert
-        assert len(offset_sources) == 3
-        # Los IDs deben ser diferentes (saltó los primeros 2)
-        offset_ids = {s.id for s in offset_sources}
-        first_two_ids = {s.id for s in all_sources[:2]}
-        assert offset_ids.isdisjoint(first_two_ids)
+        if offset:
+            # Los IDs deben ser diferentes (saltó los primeros)
+            first_ids = {s.id for s in repository.list_all(limit=offset)}
+            assert first_ids.isdisjoint(s.id for s in sources)
 
     def test_update_source(self, repository, sample_source, db_session):
         """Test 7: Actualizar fuente exitosamente"""
@@ -104,7 +93,7 @@ class TestSourceRepositoryCRUD:
 
         # Act
         updated = repository.update(sample_source)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert updated.id == sample_source.id
@@ -118,7 +107,7 @@ class TestSourceRepositoryCRUD:
 
         # Act
         repository.delete(sample_source)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         with pytest.raises(NotFoundError):
@@ -143,14 +132,30 @@ class TestSourceRepositoryCRUD:
         # Assert
         assert result is False
 
+    def test_existing_ids_after_delete(
+        self, repository, multiple_sources, db_session, existing_ids
+    ):
+        """Test 10b: delete() de varias fuentes, comprobado en una sola query"""
+        # Arrange
+        all_ids = [s.id for s in multiple_sources]
+        for source in multiple_sources[:2]:
+            repository.delete(source)
+        db_session.flush()
+
+        # Act
+        result = existing_ids(Source, all_ids + [uuid4()])
+
+        # Assert
+        assert result == set(all_ids[2:])
+
+    def test_existing_ids_empty(self, existing_ids):
+        """Test 10c: existing_ids() con lista vacía no consulta y retorna set()"""
+        assert existing_ids(Source, []) == set()
+
 
 class TestSourceRepositoryQueries:
     """Tests para queries especializadas."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SourceRepository(db_session)
-
     def test_get_active_sources(self, repository, multiple_sources):
         """Test 11: Obtener solo fuentes activas"""
         # Act
@@ -206,10 +211,6 @@ class TestSourceRepositoryQueries:
 class TestSourceRepositoryEdgeCases:
     """Tests para casos edge y validaciones."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SourceRepository(db_session)
-
     def test_list_all_empty_database(self, repository):
         """Test 17: list_all() retorna lista vacía cuando no hay datos"""
         # Act
@@ -231,7 +232,7 @@ class TestSourceRepositoryEdgeCases:
 
         # Act
         created = repository.create(source)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert created.extra_metadata is not None
@@ -245,7 +246,7 @@ class TestSourceRepositoryEdgeCases:
 
         # Act
         updated = repository.update(sample_source)
-        db_session.commit()
+        db_session.flush()
         db_session.refresh(updated)
 
         # Assert
@@ -266,7 +267,7 @@ class TestSourceRepositoryEdgeCases:
         ]
         for s in sources:
             repository.create(s)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         active = repository.get_active_sources()
@@ -3,29 +3,43 @@ Tests unitarios para SummaryRepository.
 
 Estrategia de testing:
 - Usar PostgreSQL en Docker (compatibilidad total con ARRAY, JSONB)
-- Tests aislados con limpieza automática entre tests
+- Tests aislados: cada test corre en una transacción (con SAVEPOINT) que se deshace al terminar
 - Validación de CRUD completo
 - Validación de búsqueda full-text con PostgreSQL
 - Validación de invalidación de caché
+- Paralelizable con pytest-xdist (cada worker usa su propia BD, ver conftest):
+    pytest -n auto tests/unit/repositories/test_summary_repository.py
 """
 
-from unittest.mock import Mock, patch
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
-from src.models import Summary
+from src.models import Summary, Transcription, Video, VideoStatus
+from src.repositories.exceptions import NotFoundError
 from src.repositories.summary_repository import SummaryRepository
 
+# ID fijo que nunca existe (los UUID del modelo son uuid4 aleatorios)
+_KNOWN_MISSING_ID = UUID(int=1)
+
+
+@pytest.fixture
+def repository(db_session):
+    """Fixture que crea una instancia del repository (compartida por todas las clases)."""
+    return SummaryRepository(db_session)
+
+
+@pytest.fixture
+def ro_repository(ro_session):
+    """Repository sobre la sesión de solo lectura (tests sin datos ni escrituras)."""
+    return SummaryRepository(ro_session)
+
 
 class TestSummaryRepositoryCRUD:
     """Tests para operaciones CRUD básicas."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que crea una instancia del repository."""
-        return SummaryRepository(db_session)
-
     def test_create_summary(self, repository, sample_transcription, db_session):
         """Test 1: Crear resumen exitosamente"""
         # Arrange
@@ -38,7 +52,7 @@ class TestSummaryRepositoryCRUD:
 
         # Act
         created = repository.create(summary)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert created.id is not None
@@ -57,18 +71,15 @@ class TestSummaryRepositoryCRUD:
         assert summary.id == sample_summary.id
         assert summary.summary_text == sample_summary.summary_text
 
-    def test_get_by_id_not_found(self, repository):
+    def test_get_by_id_not_found(self, ro_repository):
         """Test 3: Obtener resumen por ID inexistente con use_cache=False"""
-        # Arrange
-        non_existent_id = uuid4()
-
         # Act
-        summary = repository.get_by_id(non_existent_id, use_cache=False)
+        summary = ro_repository.get_by_id(_KNOWN_MISSING_ID, use_cache=False)
 
         # Assert
         assert summary is None
 
-    def test_list_all_summaries(self, repository, multiple_summaries):
+    def test_list_all_summaries(self, repository, shared_summaries):
         """Test 4: Listar todos los resúmenes"""
         # Act
         summaries = repository.list_all()
@@ -85,7 +96,7 @@ class TestSummaryRepositoryCRUD:
 
         # Act
         updated = repository.update(sample_summary)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert updated.id == sample_summary.id
@@ -99,7 +110,7 @@ class TestSummaryRepositoryCRUD:
 
         # Act
         repository.delete(sample_summary)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         summary = repository.get_by_id(summary_id, use_cache=False)
@@ -109,10 +120,6 @@ class TestSummaryRepositoryCRUD:
 class TestSummaryRepositoryTranscriptionQueries:
     """Tests para queries por transcription_id."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
     def test_get_by_transcription_id_found(self, repository, sample_transcription, sample_summary):
         """Test 7: Buscar resumen por transcription_id existente"""
         # Act
@@ -126,8 +133,6 @@ class TestSummaryRepositoryTranscriptionQueries:
     def test_get_by_transcription_id_not_found(self, repository, sample_transcription):
         """Test 8: Buscar por transcription_id sin resumen retorna None"""
         # Arrange - crear nueva transcripción sin resumen
-        from src.models import Transcription, Video, VideoStatus
-
         video = Video(
             source_id=sample_transcription.video.source_id,
             youtube_id="no_summary",
@@ -135,16 +140,9 @@ class TestSummaryRepositoryTranscriptionQueries:
             url="https://youtube.com/watch?v=no_summary",
             status=VideoStatus.COMPLETED,
         )
-        repository.session.add(video)
-        repository.session.commit()
-        repository.session.refresh(video)
-
-        transcription = Transcription(
-            video_id=video.id, text="Transcripción sin resumen", language="es"
-        )
-        repository.session.add(transcription)
-        repository.session.commit()
-        repository.session.refresh(transcription)
+        transcription = Transcription(video=video, text="Transcripción sin resumen", language="es")
+        repository.session.add_all([video, transcription])
+        repository.session.flush()
 
         # Act
         summary = repository.get_by_transcription_id(transcription.id)
@@ -156,11 +154,7 @@ class TestSummaryRepositoryTranscriptionQueries:
 class TestSummaryRepositoryRecent:
     """Tests para get_recent()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
-    def test_get_recent_basic(self, repository, multiple_summaries):
+    def test_get_recent_basic(self, repository, shared_summaries):
         """Test 9: Obtener resúmenes recientes básico"""
         # Act
         recent = repository.get_recent(limit=3)
@@ -171,23 +165,25 @@ class TestSummaryRepositoryRecent:
         for i in range(len(recent) - 1):
             assert recent[i].created_at >= recent[i + 1].created_at
 
-    def test_get_recent_with_relations(self, repository, multiple_summaries):
+    def test_get_recent_with_relations(self, repository, shared_summaries, count_queries):
         """Test 10: Obtener recientes con relaciones cargadas"""
         # Act
         recent = repository.get_recent(limit=2, with_relations=True)
 
         # Assert
         assert len(recent) == 2
-        # Verificar que las relaciones están cargadas
-        for summary in recent:
-            # El acceso a transcription.video.source no debe causar queries adicionales
-            assert summary.transcription is not None
-            assert summary.transcription.video is not None
-
-    def test_get_recent_empty_database(self, repository):
+        # El acceso a transcription.video.source no debe causar queries adicionales
+        with count_queries() as queries:
+            for summary in recent:
+                assert summary.transcription is not None
+                assert summary.transcription.video is not None
+                assert summary.transcription.video.source is not None
+        assert queries == []
+
+    def test_get_recent_empty_database(self, ro_repository):
         """Test 11: Obtener recientes con BD vacía"""
         # Act
-        recent = repository.get_recent()
+        recent = ro_repository.get_recent()
 
         # Assert
         assert recent == []
@@ -196,15 +192,9 @@ class TestSummaryRepositoryRecent:
 class TestSummaryRepositoryCategoryAndKeywords:
     """Tests para filtrado por categoría y keywords."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
-    def test_get_by_category(self, repository, db_session, sample_transcription):
+    def test_get_by_category(self, repository, db_session, sample_transcription, count_queries):
         """Test 12: Filtrar resúmenes por categoría"""
         # Arrange - crear resúmenes con diferentes categorías
-        from src.models import Transcription, Video, VideoStatus
-
         categories_data = [
             ("framework", ["FastAPI"]),
             ("framework", ["Django"]),
@@ -212,53 +202,70 @@ class TestSummaryRepositoryCategoryAndKeywords:
             ("tool", ["Docker"]),
         ]
 
-        for i, (category, keywords) in enumerate(categories_data):
-            video = Video(
-                source_id=sample_transcription.video.source_id,
-                youtube_id=f"cat_test_{i}",
-                title=f"Video {i}",
-                url=f"https://youtube.com/watch?v=cat_test_{i}",
-                status=VideoStatus.COMPLETED,
-            )
-            repository.session.add(video)
-            repository.session.commit()
-            repository.session.refresh(video)
-
-            trans = Transcription(video_id=video.id, text=f"Transcription {i}", language="es")
-            repository.session.add(trans)
-            repository.session.commit()
-            repository.session.refresh(trans)
-
-            summary = Summary(
-                transcription_id=trans.id,
-                summary_text=f"Summary {i}",
-                keywords=keywords,
-                category=category,
-            )
-            repository.session.add(summary)
-
-        db_session.commit()
+        # Un INSERT masivo por tabla; RETURNING (en orden) da los ids para las FK
+        video_ids = db_session.scalars(
+            insert(Video).returning(Video.id, sort_by_parameter_order=True),
+            [
+                {
+                    "source_id": sample_transcription.video.source_id,
+                    "youtube_id": f"cat_test_{i}",
+                    "title": f"Video {i}",
+                    "url": f"https://youtube.com/watch?v=cat_test_{i}",
+                    "status": VideoStatus.COMPLETED,
+                }
+                for i in range(len(categories_data))
+            ],
+        ).all()
+        transcription_ids = db_session.scalars(
+            insert(Transcription).returning(Transcription.id, sort_by_parameter_order=True),
+            [
+                {"video_id": video_id, "text": f"Transcription {i}", "language": "es"}
+                for i, video_id in enumerate(video_ids)
+            ],
+        ).all()
+        db_session.execute(
+            insert(Summary),
+            [
+                {
+                    "transcription_id": transcription_id,
+                    "summary_text": f"Summary {i}",
+                    "keywords": keywords,
+                    "category": category,
+                }
+                for i, (transcription_id, (category, keywords)) in enumerate(
+                    zip(transcription_ids, categories_data, strict=True)
+                )
+            ],
+        )
 
         # Act
-        frameworks = repository.get_by_category("framework")
+        with count_queries() as queries:
+            frameworks = repository.get_by_category("framework")
 
         # Assert
+        # SELECT con JOINs hasta Source + SELECT IN de Source.users (selectin por
+        # defecto): presupuesto constante, sin N+1
+        assert len(queries) <= 2
         assert len(frameworks) == 2
         assert all(s.category == "framework" for s in frameworks)
 
-    def test_search_by_keyword(self, repository, multiple_summaries):
+    def test_search_by_keyword(self, repository, shared_summaries, count_queries):
         """Test 13: Buscar resúmenes por keyword específico"""
         # Act - buscar keyword "Python" que está en varios resúmenes
-        python_summaries = repository.search_by_keyword("Python")
+        with count_queries() as queries:
+            python_summaries = repository.search_by_keyword("Python")
 
         # Assert
+        # SELECT con JOINs hasta Source + SELECT IN de Source.users (selectin por
+        # defecto): presupuesto constante, sin N+1
+        assert len(queries) <= 2
         assert len(python_summaries) >= 1
         # Verificar que todos contienen el keyword
         for summary in python_summaries:
             assert summary.keywords is not None
             assert "Python" in summary.keywords
 
-    def test_search_by_keyword_not_found(self, repository, multiple_summaries):
+    def test_search_by_keyword_not_found(self, repository, shared_summaries):
         """Test 14: Buscar keyword inexistente retorna lista vacía"""
         # Act
         results = repository.search_by_keyword("NonExistentKeyword")
@@ -270,15 +277,9 @@ class TestSummaryRepositoryCategoryAndKeywords:
 class TestSummaryRepositoryTelegram:
     """Tests para funcionalidad de Telegram."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
     def test_get_unsent_to_telegram(self, repository, sample_summary, db_session):
         """Test 15: Obtener resúmenes no enviados a Telegram"""
         # Arrange - crear resumen no enviado
-        from src.models import Summary, Transcription, Video, VideoStatus
-
         video = Video(
             source_id=sample_summary.transcription.video.source_id,
             youtube_id="unsent_test",
@@ -286,20 +287,12 @@ class TestSummaryRepositoryTelegram:
             url="https://youtube.com/watch?v=unsent_test",
             status=VideoStatus.COMPLETED,
         )
-        repository.session.add(video)
-        db_session.commit()
-        db_session.refresh(video)
-
-        trans = Transcription(video_id=video.id, text="Transcription for unsent", language="es")
-        repository.session.add(trans)
-        db_session.commit()
-        db_session.refresh(trans)
-
+        trans = Transcription(video=video, text="Transcription for unsent", language="es")
         unsent_summary = Summary(
-            transcription_id=trans.id, summary_text="This should be sent", sent_to_telegram=False
+            transcription=trans, summary_text="This should be sent", sent_to_telegram=False
         )
         repository.session.add(unsent_summary)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         unsent = repository.get_unsent_to_telegram()
@@ -308,28 +301,28 @@ class TestSummaryRepositoryTelegram:
         assert len(unsent) >= 1
         assert all(not s.sent_to_telegram for s in unsent)
 
-    def test_mark_as_sent(self, repository, sample_summary, db_session):
+    def test_mark_as_sent(self, repository, sample_summary):
         """Test 16: Marcar resumen como enviado"""
         # Arrange
         assert sample_summary.sent_to_telegram is False
 
-        # Act
-        repository.mark_as_sent(sample_summary.id)
-        db_session.refresh(sample_summary)
+        # Act - los valores vuelven en el RETURNING del UPDATE
+        sent, sent_at = repository.mark_as_sent(sample_summary.id)
 
         # Assert
-        assert sample_summary.sent_to_telegram is True
-        assert sample_summary.sent_at is not None
+        assert sent is True
+        assert sent_at is not None
+
+    def test_mark_as_sent_not_found(self, repository):
+        """Test 16b: Marcar como enviado un resumen inexistente lanza NotFoundError"""
+        with pytest.raises(NotFoundError):
+            repository.mark_as_sent(_KNOWN_MISSING_ID)
 
 
 class TestSummaryRepositoryPagination:
     """Tests para paginación cursor-based."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
-    def test_list_paginated_basic(self, repository, multiple_summaries):
+    def test_list_paginated_basic(self, repository, shared_summaries):
         """Test 17: Paginación básica"""
         # Act
         summaries = repository.list_paginated(limit=3)
@@ -337,7 +330,7 @@ class TestSummaryRepositoryPagination:
         # Assert
         assert len(summaries) == 3
 
-    def test_list_paginated_with_cursor(self, repository, multiple_summaries):
+    def test_list_paginated_with_cursor(self, repository, shared_summaries):
         """Test 18: Paginación con cursor"""
         # Arrange - obtener primera página
         first_page = repository.list_paginated(limit=2)
@@ -357,41 +350,31 @@ class TestSummaryRepositoryPagination:
 class TestSummaryRepositoryVideoQueries:
     """Tests para get_by_video_id()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
-    def test_get_by_video_id_found(self, repository, sample_video, sample_summary):
+    def test_get_by_video_id_found(self, repository, sample_video, sample_summary, count_queries):
         """Test 19: Buscar resumen por video_id"""
         # Act
-        summary = repository.get_by_video_id(sample_video.id)
+        with count_queries() as queries:
+            summary = repository.get_by_video_id(sample_video.id)
 
         # Assert
+        # SELECT con JOINs hasta Source + SELECT IN de Source.users (selectin por
+        # defecto): presupuesto constante, sin N+1
+        assert len(queries) <= 2
         assert summary is not None
         assert summary.id == sample_summary.id
 
-    def test_get_by_video_id_not_found(self, repository, db_session):
+    def test_get_by_video_id_not_found(self, repository, db_session, sample_source):
         """Test 20: Buscar por video_id sin resumen retorna None"""
-        # Arrange - crear video sin resumen
-        from src.models import Source, Video, VideoStatus
-
-        source = Source(
-            name="Test Source", source_type="youtube", url="https://youtube.com/@test", active=True
-        )
-        repository.session.add(source)
-        db_session.commit()
-        db_session.refresh(source)
-
+        # Arrange - crear video sin resumen (la fuente es la fixture compartida)
         video = Video(
-            source_id=source.id,
+            source_id=sample_source.id,
             youtube_id="no_summary_vid",
             title="Video without summary",
             url="https://youtube.com/watch?v=no_summary_vid",
             status=VideoStatus.PENDING,
         )
         repository.session.add(video)
-        db_session.commit()
-        db_session.refresh(video)
+        db_session.flush()
 
         # Act
         summary = repository.get_by_video_id(video.id)
@@ -403,37 +386,39 @@ class TestSummaryRepositoryVideoQueries:
 class TestSummaryRepositoryFullTextSearch:
     """Tests para búsqueda full-text."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
-    def test_search_by_text_basic_no_cache(self, repository, multiple_summaries):
-        """Test 21: Búsqueda full-text básica sin caché"""
-        # Act - buscar "FastAPI" que está en uno de los resúmenes
-        results = repository.search_by_text("FastAPI", limit=10, use_cache=False)
+    @pytest.mark.parametrize(
+        "query,expect_results",
+        [("FastAPI", True), ("XYZ123NonExistent", False)],
+        ids=["match", "no_results"],
+    )
+    def test_search_by_text_no_cache(self, repository, shared_summaries, query, expect_results):
+        """Test 21-22: Búsqueda full-text sin caché (con y sin resultados)"""
+        # Act
+        results = repository.search_by_text(query, limit=10, use_cache=False)
 
         # Assert
+        if not expect_results:
+            assert results == []
+            return
+
         assert len(results) >= 1
         # Verificar que los resultados contienen el término buscado
+        # (en el texto; solo si no aparece se miran las keywords)
+        term = query.lower()
         for summary in results:
-            text_lower = summary.summary_text.lower()
-            keywords_lower = [k.lower() for k in (summary.keywords or [])]
-            assert "fastapi" in text_lower or "fastapi" in keywords_lower
-
-    def test_search_by_text_no_results(self, repository, multiple_summaries):
-        """Test 22: Búsqueda sin resultados retorna lista vacía"""
-        # Act
-        results = repository.search_by_text("XYZ123NonExistent", use_cache=False)
+            if term in summary.summary_text.lower():
+                continue
+            assert term in {k.lower() for k in (summary.keywords or ())}
 
-        # Assert
-        assert results == []
-
-    def test_search_full_text_with_ranking(self, repository, multiple_summaries):
+    def test_search_full_text_with_ranking(self, repository, shared_summaries, count_queries):
         """Test 23: Búsqueda full-text con ranking de relevancia"""
         # Act
-        results = repository.search_full_text("Python", limit=10)
+        with count_queries() as queries:
+            results = repository.search_full_text("Python", limit=10)
 
-        # Assert
+        # Assert - la sentencia FTS preconstruida es un único SELECT; el segundo
+        # es el SELECT IN de Source.users (selectin por defecto del modelo)
+        assert len(queries) <= 2
         if len(results) > 0:
             # Verificar estructura de resultados
             for result in results:
@@ -449,71 +434,69 @@ class TestSummaryRepositoryFullTextSearch:
                     assert results[i]["relevance_score"] >= results[i + 1]["relevance_score"]
 
 
+class _FakeCache:
+    """Stub de cache_service que registra las llamadas (sin Redis ni mocks)."""
+
+    def __init__(self):
+        self.delete_calls = []
+        self.pattern_calls = []
+
+    def delete(self, key):
+        self.delete_calls.append(key)
+        return True
+
+    def invalidate_pattern(self, pattern):
+        self.pattern_calls.append(pattern)
+        return 0
+
+
 class TestSummaryRepositoryCacheInvalidation:
     """Tests para invalidación de caché."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
+    @pytest.fixture(autouse=True)
+    def fake_cache(self, monkeypatch):
+        """Sustituye cache_service y hash_query por stubs durante el test."""
+        fake = _FakeCache()
+        monkeypatch.setattr("src.services.cache_service.cache_service", fake)
+        monkeypatch.setattr("src.services.cache_service.hash_query", lambda *_: "hash123")
+        return fake
 
-    def test_invalidate_summary_cache(self, repository, sample_summary):
+    def test_invalidate_summary_cache(self, repository, sample_summary, fake_cache):
         """Test 24: Invalidar caché de un resumen específico"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.delete = Mock(return_value=True)
-
-            # Act
-            repository.invalidate_summary_cache(sample_summary.id)
+        # Act
+        repository.invalidate_summary_cache(sample_summary.id)
 
-            # Assert
-            mock_cache.delete.assert_called_once_with(f"summary:detail:{sample_summary.id}")
+        # Assert
+        assert fake_cache.delete_calls == [f"summary:detail:{sample_summary.id}"]
 
-    def test_invalidate_search_cache_all(self, repository):
+    def test_invalidate_search_cache_all(self, repository, fake_cache):
         """Test 25: Invalidar todo el caché de búsquedas"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.invalidate_pattern = Mock(return_value=5)
-
-            # Act
-            repository.invalidate_search_cache()
+        # Act
+        repository.invalidate_search_cache()
 
-            # Assert
-            mock_cache.invalidate_pattern.assert_called_once_with("search:*:results:*")
+        # Assert
+        assert fake_cache.pattern_calls == ["search:*:results:*"]
 
-    def test_invalidate_search_cache_keywords(self, repository):
+    def test_invalidate_search_cache_keywords(self, repository, fake_cache):
         """Test 26: Invalidar caché de búsquedas por keywords"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            with patch("src.services.cache_service.hash_query") as mock_hash:
-                mock_hash.return_value = "hash123"
-                mock_cache.invalidate_pattern = Mock(return_value=2)
-
-                # Act
-                repository.invalidate_search_cache(keywords=["FastAPI", "Python"])
+        # Act
+        repository.invalidate_search_cache(keywords=["FastAPI", "Python"])
 
-                # Assert
-                assert mock_cache.invalidate_pattern.call_count == 2
+        # Assert
+        assert fake_cache.pattern_calls == ["search:hash123:*", "search:hash123:*"]
 
-    def test_invalidate_recent_cache(self, repository):
+    def test_invalidate_recent_cache(self, repository, fake_cache):
         """Test 27: Invalidar caché de resúmenes recientes"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.invalidate_pattern = Mock(return_value=10)
-
-            # Act
-            repository.invalidate_recent_cache()
+        # Act
+        repository.invalidate_recent_cache()
 
-            # Assert
-            mock_cache.invalidate_pattern.assert_called_once_with("user:*:recent")
+        # Assert
+        assert fake_cache.pattern_calls == ["user:*:recent"]
 
 
 class TestSummaryRepositoryEdgeCases:
     """Tests para casos edge y validaciones."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return SummaryRepository(db_session)
-
     def test_create_with_metadata(self, repository, sample_transcription, db_session):
         """Test 28: Crear resumen con metadata JSONB completa"""
         # Arrange
@@ -532,8 +515,7 @@ class TestSummaryRepositoryEdgeCases:
 
         # Act
         created = repository.create(summary)
-        db_session.commit()
-        db_session.refresh(created)
+        db_session.flush()
 
         # Assert
         assert created.extra_metadata is not None
@@ -552,13 +534,11 @@ class TestSummaryRepositoryEdgeCases:
         )
 
         # Act & Assert
-        from sqlalchemy.exc import IntegrityError
-
         with pytest.raises(IntegrityError):
             repository.create(duplicate_summary)
-            db_session.commit()
+            db_session.flush()
 
-    def test_list_all_with_limit(self, repository, multiple_summaries):
+    def test_list_all_with_limit(self, repository, shared_summaries):
         """Test 30: Listar con límite"""
         # Act
         summaries = repository.list_all(limit=2)
@@ -15,21 +15,39 @@ Requiere PostgreSQL en Docker: docker-compose up -d postgres
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import exists, insert, inspect, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
 from src.models.telegram_user import TelegramUser
 from src.repositories.exceptions import AlreadyExistsError, NotFoundError
 from src.repositories.telegram_user_repository import TelegramUserRepository
 
 
+def _reload_with_sources(session, user_id):
+    """
+    Recarga el usuario y sus fuentes en una query + un SELECT IN.
+
+    Sustituye a session.refresh(user), que además arrastra los videos y
+    suscriptores de cada fuente (lazy="selectin" en los modelos).
+    """
+    return session.scalars(
+        select(TelegramUser)
+        .where(TelegramUser.id == user_id)
+        .options(selectinload(TelegramUser.sources).lazyload("*"))
+        .execution_options(populate_existing=True)
+    ).one()
+
+
+@pytest.fixture
+def repository(db_session):
+    """Fixture que proporciona instancia de TelegramUserRepository (compartida por las clases)."""
+    return TelegramUserRepository(db_session)
+
+
 class TestTelegramUserRepositoryCRUD:
     """Tests para operaciones CRUD básicas (heredadas de BaseRepository)."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de TelegramUserRepository."""
-        return TelegramUserRepository(db_session)
-
     def test_create_telegram_user(self, repository, db_session):
         """Test creación exitosa de usuario de Telegram."""
         # Arrange
@@ -57,12 +75,14 @@ class TestTelegramUserRepositoryCRUD:
         assert created.created_at is not None
         assert created.updated_at is not None
 
-    def test_get_by_id_found(self, repository, sample_telegram_user):
+    def test_get_by_id_found(self, repository, sample_telegram_user, count_queries):
         """Test búsqueda por UUID exitosa."""
         # Act
-        found = repository.get_by_id(sample_telegram_user.id)
+        with count_queries() as queries:
+            found = repository.get_by_id(sample_telegram_user.id)
 
-        # Assert
+        # Assert - ya está en el identity map: session.get no consulta la BD
+        assert queries == []
         assert found.id == sample_telegram_user.id
         assert found.telegram_id == sample_telegram_user.telegram_id
 
@@ -99,9 +119,10 @@ class TestTelegramUserRepositoryCRUD:
         # Act
         repository.delete(sample_telegram_user)
 
-        # Assert
-        found = db_session.get(TelegramUser, user_id)
-        assert found is None  # Eliminación física (BaseRepository.delete)
+        # Assert - EXISTS sin hidratar la entidad
+        assert not db_session.scalar(
+            select(exists().where(TelegramUser.id == user_id))
+        )  # Eliminación física (BaseRepository.delete)
 
     def test_list_all_telegram_users(
         self, repository, sample_telegram_user, inactive_telegram_user
@@ -111,20 +132,13 @@ class TestTelegramUserRepositoryCRUD:
         users = repository.list_all()
 
         # Assert
-        assert len(users) >= 2
-        telegram_ids = [user.telegram_id for user in users]
-        assert sample_telegram_user.telegram_id in telegram_ids
-        assert inactive_telegram_user.telegram_id in telegram_ids
+        expected = {sample_telegram_user.telegram_id, inactive_telegram_user.telegram_id}
+        assert expected <= {user.telegram_id for user in users}
 
 
 class TestTelegramUserRepositoryQueriesByTelegramId:
     """Tests para queries por telegram_id."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de TelegramUserRepository."""
-        return TelegramUserRepository(db_session)
-
     def test_get_by_telegram_id_found(self, repository, sample_telegram_user):
         """Test búsqueda por telegram_id exitosa."""
         # Act
@@ -163,16 +177,11 @@ class TestTelegramUserRepositoryQueriesByTelegramId:
 class TestTelegramUserRepositorySubscriptions:
     """Tests para gestión de suscripciones many-to-many."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de TelegramUserRepository."""
-        return TelegramUserRepository(db_session)
-
     def test_subscribe_to_source(self, repository, sample_telegram_user, sample_source, db_session):
         """Test suscripción exitosa a una fuente."""
         # Act
         repository.subscribe_to_source(sample_telegram_user.id, sample_source.id)
-        db_session.refresh(sample_telegram_user)
+        sample_telegram_user = _reload_with_sources(db_session, sample_telegram_user.id)
 
         # Assert
         assert len(sample_telegram_user.sources) == 1
@@ -215,7 +224,9 @@ class TestTelegramUserRepositorySubscriptions:
 
         # Act
         repository.unsubscribe_from_source(telegram_user_with_subscriptions.id, sample_source.id)
-        db_session.refresh(telegram_user_with_subscriptions)
+        telegram_user_with_subscriptions = _reload_with_sources(
+            db_session, telegram_user_with_subscriptions.id
+        )
 
         # Assert
         assert len(telegram_user_with_subscriptions.sources) == 0
@@ -242,6 +253,21 @@ class TestTelegramUserRepositorySubscriptions:
         assert len(subscriptions) == 1
         assert subscriptions[0].id == sample_source.id
 
+    def test_get_user_subscriptions_does_not_eager_load_videos(
+        self, repository, telegram_user_with_subscriptions, db_session
+    ):
+        """Test get_user_subscriptions no arrastra los videos de cada fuente."""
+        # Arrange - sesión vacía: las instancias se cargan de nuevo
+        user_id = telegram_user_with_subscriptions.id
+        db_session.expunge_all()
+
+        # Act
+        subscriptions = repository.get_user_subscriptions(user_id)
+
+        # Assert
+        assert len(subscriptions) == 1
+        assert "videos" in inspect(subscriptions[0]).unloaded
+
     def test_get_user_subscriptions_empty(self, repository, sample_telegram_user):
         """Test obtener suscripciones de usuario sin suscripciones."""
         # Act
@@ -251,17 +277,37 @@ class TestTelegramUserRepositorySubscriptions:
         assert len(subscriptions) == 0
 
     def test_get_source_subscribers(
-        self, repository, sample_source, telegram_user_with_subscriptions, db_session
+        self, repository, sample_source, telegram_user_with_subscriptions, count_queries
     ):
         """Test obtener usuarios suscritos a una fuente."""
         # Act
-        subscribers = repository.get_source_subscribers(sample_source.id)
+        with count_queries() as queries:
+            subscribers = repository.get_source_subscribers(sample_source.id)
 
-        # Assert
+        # Assert - fuente + SELECT IN de suscriptores, sin N+1
+        assert len(queries) <= 2
         assert len(subscribers) >= 1
         subscriber_ids = [user.id for user in subscribers]
         assert telegram_user_with_subscriptions.id in subscriber_ids
 
+    def test_get_source_subscribers_does_not_eager_load_videos(
+        self, repository, sample_source, telegram_user_with_subscriptions, db_session, count_queries
+    ):
+        """Test get_source_subscribers no carga los videos ni las suscripciones."""
+        # Arrange - sesión vacía: la fuente se carga de nuevo
+        source_id = sample_source.id
+        db_session.expunge_all()
+
+        # Act
+        with count_queries() as queries:
+            subscribers = repository.get_source_subscribers(source_id)
+
+        # Assert - fuente + SELECT IN de suscriptores (un SELECT IN de videos
+        # sería una tercera query)
+        assert len(queries) == 2
+        assert len(subscribers) == 1
+        assert "sources" in inspect(subscribers[0]).unloaded
+
     def test_get_source_subscribers_empty(self, repository, inactive_source):
         """Test obtener suscriptores de fuente sin suscriptores."""
         # Act
@@ -302,11 +348,6 @@ class TestTelegramUserRepositorySubscriptions:
 class TestTelegramUserRepositoryConstraints:
     """Tests para constraints de unicidad."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de TelegramUserRepository."""
-        return TelegramUserRepository(db_session)
-
     def test_unique_telegram_id_constraint(self, repository, sample_telegram_user, db_session):
         """Test que telegram_id debe ser único (IntegrityError en duplicado)."""
         # Arrange - Intentar crear usuario con telegram_id duplicado
@@ -324,11 +365,6 @@ class TestTelegramUserRepositoryConstraints:
 class TestTelegramUserRepositoryEdgeCases:
     """Tests para casos edge y escenarios especiales."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de TelegramUserRepository."""
-        return TelegramUserRepository(db_session)
-
     def test_create_user_with_minimal_fields(self, repository, db_session):
         """Test creación con campos mínimos (solo telegram_id requerido)."""
         # Arrange
@@ -364,7 +400,7 @@ class TestTelegramUserRepositoryEdgeCases:
         assert created.is_active is False
 
     def test_multiple_subscriptions(
-        self, repository, sample_telegram_user, multiple_sources, db_session
+        self, repository, sample_telegram_user, multiple_sources, db_session, count_queries
     ):
         """Test usuario con múltiples suscripciones."""
         # Arrange - Suscribir a 3 fuentes
@@ -372,28 +408,35 @@ class TestTelegramUserRepositoryEdgeCases:
             repository.subscribe_to_source(sample_telegram_user.id, source.id)
 
         # Act
-        db_session.refresh(sample_telegram_user)
-        subscriptions = repository.get_user_subscriptions(sample_telegram_user.id)
+        sample_telegram_user = _reload_with_sources(db_session, sample_telegram_user.id)
+        with count_queries() as queries:
+            subscriptions = repository.get_user_subscriptions(sample_telegram_user.id)
 
-        # Assert
+        # Assert - usuario + SELECT IN de fuentes, no una query por fuente
+        assert len(queries) <= 2
         assert len(subscriptions) == 3
 
-    def test_language_code_variations(self, repository, db_session):
+    def test_language_code_variations(self, db_session):
         """Test diferentes códigos de idioma."""
         # Arrange
         languages = ["es", "en", "pt", "fr", "de"]
-        created_users = []
 
-        # Act
-        for i, lang in enumerate(languages):
-            user = TelegramUser(telegram_id=100000000 + i, language_code=lang)
-            created = repository.create(user)
-            created_users.append(created)
+        # Act - un solo INSERT masivo (insertmanyvalues), sin RETURNING
+        db_session.execute(
+            insert(TelegramUser),
+            [
+                {"telegram_id": 100000000 + i, "language_code": lang}
+                for i, lang in enumerate(languages)
+            ],
+        )
 
-        # Assert
-        assert len(created_users) == 5
-        for i, lang in enumerate(languages):
-            assert created_users[i].language_code == lang
+        # Assert - una sola SELECT de la columna, en el orden de inserción
+        found = db_session.scalars(
+            select(TelegramUser.language_code)
+            .where(TelegramUser.telegram_id.between(100000000, 100000000 + len(languages) - 1))
+            .order_by(TelegramUser.telegram_id)
+        ).all()
+        assert found == languages
 
     def test_full_name_property(self, repository, db_session):
         """Test propiedad full_name del modelo."""
@@ -419,7 +462,7 @@ class TestTelegramUserRepositoryEdgeCases:
         assert created2.display_name == "Jane Smith"
 
     def test_subscription_count_property(
-        self, repository, sample_telegram_user, multiple_sources, db_session
+        self, repository, sample_telegram_user, multiple_sources, db_session, count_queries
     ):
         """Test propiedad subscription_count del modelo."""
         # Arrange - Sin suscripciones
@@ -428,10 +471,13 @@ class TestTelegramUserRepositoryEdgeCases:
         # Act - Añadir 2 suscripciones
         repository.subscribe_to_source(sample_telegram_user.id, multiple_sources[0].id)
         repository.subscribe_to_source(sample_telegram_user.id, multiple_sources[1].id)
-        db_session.refresh(sample_telegram_user)
+        sample_telegram_user = _reload_with_sources(db_session, sample_telegram_user.id)
+        with count_queries() as queries:
+            subscription_count = sample_telegram_user.subscription_count
 
-        # Assert
-        assert sample_telegram_user.subscription_count == 2
+        # Assert - con las fuentes ya cargadas la propiedad no consulta la BD
+        assert queries == []
+        assert subscription_count == 2
 
     def test_has_subscriptions_property(
         self, repository, sample_telegram_user, sample_source, db_session
@@ -442,7 +488,7 @@ class TestTelegramUserRepositoryEdgeCases:
 
         # Act - Añadir suscripción
         repository.subscribe_to_source(sample_telegram_user.id, sample_source.id)
-        db_session.refresh(sample_telegram_user)
+        sample_telegram_user = _reload_with_sources(db_session, sample_telegram_user.id)
 
         # Assert
         assert sample_telegram_user.has_subscriptions is True
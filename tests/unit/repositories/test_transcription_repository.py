@@ -11,20 +11,23 @@ Estrategia de testing:
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
-from src.models import Transcription
+from src.models import Transcription, Video, VideoStatus
 from src.repositories.exceptions import NotFoundError
 from src.repositories.transcription_repository import TranscriptionRepository
 
 
+@pytest.fixture
+def repository(db_session):
+    """Fixture que crea una instancia del repository (compartida por todas las clases)."""
+    return TranscriptionRepository(db_session)
+
+
 class TestTranscriptionRepositoryCRUD:
     """Tests para operaciones CRUD básicas."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que crea una instancia del repository."""
-        return TranscriptionRepository(db_session)
-
     def test_create_transcription(self, repository, sample_video, db_session):
         """Test 1: Crear transcripción exitosamente"""
         # Arrange
@@ -38,7 +41,7 @@ class TestTranscriptionRepositoryCRUD:
 
         # Act
         created = repository.create(transcription)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert created.id is not None
@@ -47,12 +50,14 @@ class TestTranscriptionRepositoryCRUD:
         assert created.language == "es"
         assert created.model_used == "whisper-base"
 
-    def test_get_by_id_found(self, repository, sample_transcription):
+    def test_get_by_id_found(self, repository, sample_transcription, count_queries):
         """Test 2: Obtener transcripción por ID existente"""
         # Act
-        transcription = repository.get_by_id(sample_transcription.id)
+        with count_queries() as queries:
+            transcription = repository.get_by_id(sample_transcription.id)
 
-        # Assert
+        # Assert - ya está en el identity map: session.get no consulta la BD
+        assert queries == []
         assert transcription is not None
         assert transcription.id == sample_transcription.id
         assert transcription.video_id == sample_transcription.video_id
@@ -84,7 +89,7 @@ class TestTranscriptionRepositoryCRUD:
 
         # Act
         updated = repository.update(sample_transcription)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert updated.id == sample_transcription.id
@@ -98,7 +103,7 @@ class TestTranscriptionRepositoryCRUD:
 
         # Act
         repository.delete(sample_transcription)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         with pytest.raises(NotFoundError):
@@ -108,10 +113,6 @@ class TestTranscriptionRepositoryCRUD:
 class TestTranscriptionRepositoryVideoQueries:
     """Tests para queries por video_id."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return TranscriptionRepository(db_session)
-
     def test_get_by_video_id_found(self, repository, sample_video, sample_transcription):
         """Test 7: Buscar transcripción por video_id existente"""
         # Act
@@ -125,8 +126,6 @@ class TestTranscriptionRepositoryVideoQueries:
     def test_get_by_video_id_not_found(self, repository, sample_video):
         """Test 8: Buscar por video_id sin transcripción retorna None"""
         # Arrange - sample_video sin transcripción (crear nuevo video sin transcripción)
-        from src.models import Video, VideoStatus
-
         video_without_transcription = Video(
             source_id=sample_video.source_id,
             youtube_id="no_transcription",
@@ -135,7 +134,7 @@ class TestTranscriptionRepositoryVideoQueries:
             status=VideoStatus.PENDING,
         )
         repository.session.add(video_without_transcription)
-        repository.session.commit()
+        repository.session.flush()
 
         # Act
         transcription = repository.get_by_video_id(video_without_transcription.id)
@@ -155,8 +154,6 @@ class TestTranscriptionRepositoryVideoQueries:
     def test_exists_by_video_id_false(self, repository, sample_video):
         """Test 10: exists_by_video_id() retorna False para video sin transcripción"""
         # Arrange - crear video sin transcripción
-        from src.models import Video, VideoStatus
-
         video_without_transcription = Video(
             source_id=sample_video.source_id,
             youtube_id="no_transcription2",
@@ -165,7 +162,7 @@ class TestTranscriptionRepositoryVideoQueries:
             status=VideoStatus.PENDING,
         )
         repository.session.add(video_without_transcription)
-        repository.session.commit()
+        repository.session.flush()
 
         # Act
         result = repository.exists_by_video_id(video_without_transcription.id)
@@ -177,10 +174,6 @@ class TestTranscriptionRepositoryVideoQueries:
 class TestTranscriptionRepositoryLanguageQueries:
     """Tests para queries por idioma."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return TranscriptionRepository(db_session)
-
     def test_get_by_language_spanish(self, repository, sample_transcription):
         """Test 11: Obtener transcripciones en español"""
         # Act
@@ -210,36 +203,32 @@ class TestTranscriptionRepositoryLanguageQueries:
     def test_get_by_language_multiple(self, repository, db_session, sample_source):
         """Test 14: Múltiples transcripciones del mismo idioma"""
         # Arrange - crear varias transcripciones en español
-        from src.models import Video, VideoStatus
-
-        videos = []
-        transcriptions = []
-
-        for i in range(3):
-            video = Video(
-                source_id=sample_source.id,
-                youtube_id=f"video_es_{i}",
-                title=f"Video {i}",
-                url=f"https://youtube.com/watch?v=video_es_{i}",
-                status=VideoStatus.COMPLETED,
-            )
-            repository.session.add(video)
-            videos.append(video)
-
-        db_session.commit()
-
-        for video in videos:
-            db_session.refresh(video)
-            trans = Transcription(
-                video_id=video.id,
-                text=f"Transcripción {video.youtube_id}",
-                language="es",
-                model_used="whisper-base",
-            )
-            repository.session.add(trans)
-            transcriptions.append(trans)
-
-        db_session.commit()
+        # Un INSERT masivo por tabla; RETURNING (en orden) da los ids para las FK
+        video_ids = db_session.scalars(
+            insert(Video).returning(Video.id, sort_by_parameter_order=True),
+            [
+                {
+                    "source_id": sample_source.id,
+                    "youtube_id": f"video_es_{i}",
+                    "title": f"Video {i}",
+                    "url": f"https://youtube.com/watch?v=video_es_{i}",
+                    "status": VideoStatus.COMPLETED,
+                }
+                for i in range(3)
+            ],
+        ).all()
+        db_session.execute(
+            insert(Transcription),
+            [
+                {
+                    "video_id": video_id,
+                    "text": f"Transcripción video_es_{i}",
+                    "language": "es",
+                    "model_used": "whisper-base",
+                }
+                for i, video_id in enumerate(video_ids)
+            ],
+        )
 
         # Act
         spanish = repository.get_by_language("es")
@@ -252,10 +241,6 @@ class TestTranscriptionRepositoryLanguageQueries:
 class TestTranscriptionRepositoryPagination:
     """Tests para paginación cursor-based."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return TranscriptionRepository(db_session)
-
     def test_list_paginated_basic(self, repository, sample_transcription, english_transcription):
         """Test 15: Paginación básica"""
         # Act
@@ -264,23 +249,20 @@ class TestTranscriptionRepositoryPagination:
         # Assert
         assert len(transcriptions) <= 2
 
-    def test_list_paginated_with_cursor(self, repository, multiple_summaries):
-        """Test 16: Paginación con cursor"""
-        # Note: multiple_summaries fixture crea transcripciones automáticamente
+    @pytest.mark.parametrize("limit", [1, 2, 5])
+    def test_list_paginated_with_cursor(self, repository, shared_summaries, limit):
+        """Test 16: Paginación con cursor (mismos datos de clase para cada limit)"""
+        # Note: shared_summaries crea 5 transcripciones UNA VEZ por clase
         # Arrange - obtener primera página
-        first_page = repository.list_paginated(limit=2)
-        assert len(first_page) > 0, "Should have results in first page"
-        cursor = first_page[-1].id
+        first_page = repository.list_paginated(limit=limit)
+        assert 0 < len(first_page) <= limit, "Should have results in first page"
 
         # Act - obtener segunda página
-        second_page = repository.list_paginated(limit=2, cursor=cursor)
+        second_page = repository.list_paginated(limit=limit, cursor=first_page[-1].id)
 
         # Assert - puede haber menos si no hay suficientes transcripciones
         # Los IDs deben ser diferentes
-        first_ids = {t.id for t in first_page}
-        second_ids = {t.id for t in second_page}
-        if second_page:
-            assert first_ids.isdisjoint(second_ids)
+        assert {t.id for t in first_page}.isdisjoint({t.id for t in second_page})
 
     def test_list_paginated_empty_database(self, repository):
         """Test 17: Paginación con BD vacía"""
@@ -294,10 +276,6 @@ class TestTranscriptionRepositoryPagination:
 class TestTranscriptionRepositoryEdgeCases:
     """Tests para casos edge y validaciones."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return TranscriptionRepository(db_session)
-
     def test_create_with_segments(self, repository, sample_video, db_session):
         """Test 18: Crear transcripción con segmentos JSONB"""
         # Arrange
@@ -318,7 +296,7 @@ class TestTranscriptionRepositoryEdgeCases:
 
         # Act
         created = repository.create(transcription)
-        db_session.commit()
+        db_session.flush()
         db_session.refresh(created)
 
         # Assert
@@ -334,7 +312,7 @@ class TestTranscriptionRepositoryEdgeCases:
 
         # Act
         updated = repository.update(sample_transcription)
-        db_session.commit()
+        db_session.flush()
         db_session.refresh(updated)
 
         # Assert
@@ -350,8 +328,6 @@ class TestTranscriptionRepositoryEdgeCases:
         )
 
         # Act & Assert
-        from sqlalchemy.exc import IntegrityError
-
         with pytest.raises(IntegrityError):
             repository.create(duplicate_transcription)
-            db_session.commit()
+            db_session.flush()
@@ -12,28 +12,34 @@ Requiere PostgreSQL en Docker: docker-compose up -d postgres
 """
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 
 from src.models.user import User
 from src.repositories.exceptions import NotFoundError
 from src.repositories.user_repository import UserRepository
 
+# Hashes de contraseña de prueba (no se verifican: solo se guardan)
+_HASHED_PW = "$2b$12$hash"
+_BCRYPT_SAMPLE = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5NU8KQDpTMWBq"  # 60 chars
+
+
+@pytest.fixture
+def repository(db_session):
+    """Fixture que proporciona instancia de UserRepository (compartida por las clases)."""
+    return UserRepository(db_session)
+
 
 class TestUserRepositoryCRUD:
     """Tests para operaciones CRUD básicas de UserRepository."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de UserRepository."""
-        return UserRepository(db_session)
-
     def test_create_user(self, repository, db_session):
         """Test creación exitosa de usuario."""
         # Arrange
         user = User(
             username="johndoe",
             email="john@example.com",
-            hashed_password="$2b$12$hashed_password_here",
+            hashed_password=_HASHED_PW,
             role="user",
         )
 
@@ -106,11 +112,6 @@ class TestUserRepositoryCRUD:
 class TestUserRepositoryQueries:
     """Tests para queries especializadas de UserRepository."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de UserRepository."""
-        return UserRepository(db_session)
-
     def test_get_by_username_found(self, repository, sample_user):
         """Test búsqueda por username exitosa."""
         # Act
@@ -151,7 +152,7 @@ class TestUserRepositoryQueries:
         """Test obtener solo usuarios activos."""
         # Arrange - Desactivar un usuario
         regular_user.is_active = False
-        db_session.commit()
+        db_session.flush()
 
         # Act
         active_users = repository.get_all_active()
@@ -165,7 +166,7 @@ class TestUserRepositoryQueries:
         """Test get_all_active cuando no hay usuarios activos."""
         # Arrange - Desactivar todos
         sample_user.is_active = False
-        db_session.commit()
+        db_session.flush()
 
         # Act
         active_users = repository.get_all_active()
@@ -177,18 +178,13 @@ class TestUserRepositoryQueries:
 class TestUserRepositoryConstraints:
     """Tests para constraints de unicidad en UserRepository."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de UserRepository."""
-        return UserRepository(db_session)
-
     def test_unique_username_constraint(self, repository, sample_user, db_session):
         """Test que username debe ser único (IntegrityError en duplicado)."""
         # Arrange - Intentar crear usuario con username duplicado
         duplicate_user = User(
             username="admin",  # Username ya existe
             email="different@example.com",
-            hashed_password="$2b$12$hash",
+            hashed_password=_HASHED_PW,
             role="user",
         )
 
@@ -204,7 +200,7 @@ class TestUserRepositoryConstraints:
         duplicate_user = User(
             username="different_user",
             email="admin@test.com",  # Email ya existe
-            hashed_password="$2b$12$hash",
+            hashed_password=_HASHED_PW,
             role="user",
         )
 
@@ -218,18 +214,13 @@ class TestUserRepositoryConstraints:
 class TestUserRepositoryEdgeCases:
     """Tests para casos edge de UserRepository."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que proporciona instancia de UserRepository."""
-        return UserRepository(db_session)
-
     def test_create_user_with_minimal_fields(self, repository, db_session):
         """Test creación con campos mínimos requeridos."""
         # Arrange
         user = User(
             username="minimal",
             email="minimal@example.com",
-            hashed_password="$2b$12$hash",
+            hashed_password=_HASHED_PW,
             role="user",  # Role tiene default pero lo especificamos
         )
 
@@ -241,36 +232,30 @@ class TestUserRepositoryEdgeCases:
         assert created.is_active is True  # Default value
         assert created.role == "user"
 
-    def test_create_user_with_all_roles(self, repository, db_session):
+    @pytest.mark.parametrize("role", ["admin", "user", "bot"])
+    def test_create_user_with_all_roles(self, repository, role):
         """Test creación de usuarios con diferentes roles."""
         # Arrange
-        roles = ["admin", "user", "bot"]
-        created_users = []
+        user = User(
+            username=f"user_{role}",
+            email=f"{role}@example.com",
+            hashed_password=_HASHED_PW,
+            role=role,
+        )
 
         # Act
-        for role in roles:
-            user = User(
-                username=f"user_{role}",
-                email=f"{role}@example.com",
-                hashed_password="$2b$12$hash",
-                role=role,
-            )
-            created = repository.create(user)
-            created_users.append(created)
+        created = repository.create(user)
 
         # Assert
-        assert len(created_users) == 3
-        for i, role in enumerate(roles):
-            assert created_users[i].role == role
+        assert created.role == role
 
     def test_password_is_stored_hashed(self, repository, db_session):
         """Test que las contraseñas se almacenan hasheadas."""
         # Arrange
-        hashed_password = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5NU8KQDpTMWBq"
         user = User(
             username="secure_user",
             email="secure@example.com",
-            hashed_password=hashed_password,
+            hashed_password=_BCRYPT_SAMPLE,
             role="user",
         )
 
@@ -278,23 +263,26 @@ class TestUserRepositoryEdgeCases:
         created = repository.create(user)
 
         # Assert
-        assert created.hashed_password == hashed_password
+        assert created.hashed_password == _BCRYPT_SAMPLE
         assert created.hashed_password.startswith("$2b$")  # bcrypt hash format
         assert len(created.hashed_password) == 60  # bcrypt hash length
 
     def test_get_all_active_with_mixed_states(self, repository, db_session):
         """Test get_all_active con mix de usuarios activos/inactivos."""
-        # Arrange - Crear 3 activos y 2 inactivos
-        for i in range(5):
-            user = User(
-                username=f"user{i}",
-                email=f"user{i}@example.com",
-                hashed_password="$2b$12$hash",
-                role="user",
-                is_active=(i < 3),  # Primeros 3 activos, últimos 2 inactivos
-            )
-            db_session.add(user)
-        db_session.commit()
+        # Arrange - Crear 3 activos y 2 inactivos (un solo INSERT masivo)
+        db_session.execute(
+            insert(User),
+            [
+                {
+                    "username": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "hashed_password": _HASHED_PW,
+                    "role": "user",
+                    "is_active": i < 3,  # Primeros 3 activos, últimos 2 inactivos
+                }
+                for i in range(5)
+            ],
+        )
 
         # Act
         active_users = repository.get_all_active()
@@ -11,8 +11,8 @@ Estrategia de testing:
 """
 
 from datetime import datetime
-from unittest.mock import Mock, patch
-from uuid import uuid4
+from unittest.mock import Mock
+from uuid import UUID
 
 import pytest
 
@@ -21,15 +21,27 @@ from src.models.video import VideoStatus
 from src.repositories.exceptions import NotFoundError
 from src.repositories.video_repository import VideoRepository
 
+# ID fijo que nunca existe (los UUID del modelo son uuid4 aleatorios)
+_KNOWN_MISSING_ID = UUID(int=1)
+
+
+@pytest.fixture
+def repository(db_session):
+    """Fixture que crea una instancia del repository (compartida por todas las clases)."""
+    return VideoRepository(db_session)
+
+
+@pytest.fixture
+def mock_cache(monkeypatch):
+    """Sustituye cache_service por un Mock durante el test."""
+    mock = Mock()
+    monkeypatch.setattr("src.services.cache_service.cache_service", mock)
+    return mock
+
 
 class TestVideoRepositoryCRUD:
     """Tests para operaciones CRUD básicas."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        """Fixture que crea una instancia del repository."""
-        return VideoRepository(db_session)
-
     def test_create_video(self, repository, sample_source, db_session):
         """Test 1: Crear video exitosamente"""
         # Arrange
@@ -44,7 +56,7 @@ class TestVideoRepositoryCRUD:
 
         # Act
         created = repository.create(video)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert created.id is not None
@@ -66,12 +78,9 @@ class TestVideoRepositoryCRUD:
 
     def test_get_by_id_not_found(self, repository):
         """Test 3: Obtener video por ID inexistente lanza NotFoundError"""
-        # Arrange
-        non_existent_id = uuid4()
-
         # Act & Assert
         with pytest.raises(NotFoundError):
-            repository.get_by_id(non_existent_id)
+            repository.get_by_id(_KNOWN_MISSING_ID)
 
     def test_list_all_videos(self, repository, multiple_videos):
         """Test 4: Listar todos los videos"""
@@ -90,7 +99,7 @@ class TestVideoRepositoryCRUD:
 
         # Act
         updated = repository.update(sample_video)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         assert updated.id == sample_video.id
@@ -104,7 +113,7 @@ class TestVideoRepositoryCRUD:
 
         # Act
         repository.delete(sample_video)
-        db_session.commit()
+        db_session.flush()
 
         # Assert
         with pytest.raises(NotFoundError):
@@ -114,36 +123,19 @@ class TestVideoRepositoryCRUD:
 class TestVideoRepositoryStatusQueries:
     """Tests para queries por estado."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
-    def test_get_by_status_pending(self, repository, multiple_videos):
-        """Test 7: Obtener solo videos pendientes"""
-        # Act
-        pending = repository.get_by_status(VideoStatus.PENDING)
-
-        # Assert
-        assert len(pending) == 3  # 3 PENDING en multiple_videos
-        assert all(v.status == VideoStatus.PENDING for v in pending)
-
-    def test_get_by_status_completed(self, repository, multiple_videos):
-        """Test 8: Obtener solo videos completados"""
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [(VideoStatus.PENDING, 3), (VideoStatus.COMPLETED, 3), (VideoStatus.FAILED, 2)],
+        ids=["pending", "completed", "failed"],
+    )
+    def test_get_by_status(self, repository, shared_videos, status, expected):
+        """Test 7-9: Obtener solo videos del estado pedido"""
         # Act
-        completed = repository.get_by_status(VideoStatus.COMPLETED)
-
-        # Assert
-        assert len(completed) == 3  # 3 COMPLETED en multiple_videos
-        assert all(v.status == VideoStatus.COMPLETED for v in completed)
+        videos = repository.get_by_status(status)
 
-    def test_get_by_status_failed(self, repository, multiple_videos):
-        """Test 9: Obtener solo videos fallidos"""
-        # Act
-        failed = repository.get_by_status(VideoStatus.FAILED)
-
-        # Assert
-        assert len(failed) == 2  # 2 FAILED en multiple_videos
-        assert all(v.status == VideoStatus.FAILED for v in failed)
+        # Assert - conteos de multiple_videos/shared_videos
+        assert len(videos) == expected
+        assert all(v.status == status for v in videos)
 
     def test_get_by_status_empty(self, repository, sample_video):
         """Test 10: Estado sin videos retorna lista vacía"""
@@ -157,10 +149,6 @@ class TestVideoRepositoryStatusQueries:
 class TestVideoRepositorySourceQueries:
     """Tests para queries por source."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
     def test_get_by_source(self, repository, sample_source, multiple_videos):
         """Test 11: Obtener videos de una fuente específica"""
         # Act
@@ -205,10 +193,6 @@ class TestVideoRepositorySourceQueries:
 class TestVideoRepositoryYouTubeIDQueries:
     """Tests para queries por youtube_id."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
     def test_get_by_youtube_id_found(self, repository, sample_video):
         """Test 15: Buscar video por youtube_id existente"""
         # Act
@@ -247,15 +231,10 @@ class TestVideoRepositoryYouTubeIDQueries:
 class TestVideoRepositorySoftDelete:
     """Tests para soft delete."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
-    def test_soft_delete_sets_deleted_at(self, repository, sample_video, db_session):
+    def test_soft_delete_sets_deleted_at(self, repository, sample_video):
         """Test 19: soft_delete() establece deleted_at"""
         # Act
         deleted = repository.soft_delete(sample_video.id)
-        db_session.refresh(deleted)
 
         # Assert
         assert deleted.deleted_at is not None
@@ -263,19 +242,16 @@ class TestVideoRepositorySoftDelete:
         assert isinstance(deleted.deleted_at, datetime)
 
     def test_soft_delete_not_found(self, repository):
-        """Test 20: soft_delete() de video inexistente lanza ValueError"""
-        # Arrange
-        non_existent_id = uuid4()
-
+        """Test 20: soft_delete() de video inexistente lanza NotFoundError"""
         # Act & Assert
         with pytest.raises(NotFoundError):
-            repository.soft_delete(non_existent_id)
+            repository.soft_delete(_KNOWN_MISSING_ID)
 
     def test_list_paginated_excludes_deleted_by_default(self, repository, sample_video, db_session):
         """Test 21: list_paginated() excluye soft-deleted por default"""
         # Arrange - soft delete el video
         repository.soft_delete(sample_video.id)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         videos = repository.list_paginated()
@@ -291,7 +267,7 @@ class TestVideoRepositorySoftDelete:
         """Test 22: list_paginated() incluye soft-deleted si se solicita"""
         # Arrange - soft delete el video
         repository.soft_delete(sample_video.id)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         videos = repository.list_paginated(include_deleted=True)
@@ -305,10 +281,6 @@ class TestVideoRepositorySoftDelete:
 class TestVideoRepositoryPagination:
     """Tests para paginación cursor-based."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
     def test_list_paginated_basic(self, repository, multiple_videos):
         """Test 23: Paginación básica"""
         # Act
@@ -356,34 +328,28 @@ class TestVideoRepositoryPagination:
 class TestVideoRepositoryCreateVideo:
     """Tests para método create_video()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
-    def test_create_video_invalidates_cache(self, repository, sample_source, db_session):
+    def test_create_video_invalidates_cache(
+        self, repository, sample_source, db_session, mock_cache
+    ):
         """Test 27: create_video() invalida caché de estadísticas"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.delete = Mock()
-
-            # Act
-            video = repository.create_video(
-                source_id=sample_source.id,
-                youtube_id="test456",
-                title="Test Video",
-                url="https://youtube.com/watch?v=test456",
-                duration_seconds=300,
-            )
-            db_session.commit()
-
-            # Assert
-            assert video.id is not None
-            # Verificar que se invalidó el caché (2 llamadas: global + source)
-            assert mock_cache.delete.call_count == 2
-            mock_cache.delete.assert_any_call("stats:global")
-            mock_cache.delete.assert_any_call(f"stats:source:{sample_source.id}")
-
-    def test_create_video_with_metadata(self, repository, sample_source, db_session):
+        # Act
+        video = repository.create_video(
+            source_id=sample_source.id,
+            youtube_id="test456",
+            title="Test Video",
+            url="https://youtube.com/watch?v=test456",
+            duration_seconds=300,
+        )
+        db_session.flush()
+
+        # Assert
+        assert video.id is not None
+        # Verificar que se invalidó el caché (2 llamadas: global + source)
+        assert mock_cache.delete.call_count == 2
+        mock_cache.delete.assert_any_call("stats:global")
+        mock_cache.delete.assert_any_call(f"stats:source:{sample_source.id}")
+
+    def test_create_video_with_metadata(self, repository, sample_source):
         """Test 28: create_video() con metadata"""
         # Arrange
         metadata = {"view_count": 1000, "like_count": 50}
@@ -396,8 +362,6 @@ class TestVideoRepositoryCreateVideo:
             url="https://youtube.com/watch?v=test789",
             metadata=metadata,
         )
-        db_session.commit()
-        db_session.refresh(video)
 
         # Assert
         assert video.extra_metadata is not None
@@ -408,58 +372,41 @@ class TestVideoRepositoryCreateVideo:
 class TestVideoRepositoryUpdateVideo:
     """Tests para método update_video()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
-    def test_update_video_status_invalidates_cache(self, repository, sample_video, db_session):
+    def test_update_video_status_invalidates_cache(
+        self, repository, sample_video, db_session, mock_cache
+    ):
         """Test 29: update_video() con cambio de status invalida caché"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.delete = Mock()
-
-            # Act
-            updated = repository.update_video(sample_video.id, status=VideoStatus.COMPLETED)
+        # Act
+        updated = repository.update_video(sample_video.id, status=VideoStatus.COMPLETED)
 
-            # Assert
-            assert updated.status == VideoStatus.COMPLETED
-            # Verificar que se invalidó el caché
-            assert mock_cache.delete.call_count == 2
-            mock_cache.delete.assert_any_call("stats:global")
+        # Assert
+        assert updated.status == VideoStatus.COMPLETED
+        # Verificar que se invalidó el caché
+        assert mock_cache.delete.call_count == 2
+        mock_cache.delete.assert_any_call("stats:global")
 
     def test_update_video_title_does_not_invalidate_cache(
-        self, repository, sample_video, db_session
+        self, repository, sample_video, db_session, mock_cache
     ):
         """Test 30: update_video() sin cambio de status NO invalida caché"""
-        # Arrange
-        with patch("src.services.cache_service.cache_service") as mock_cache:
-            mock_cache.delete = Mock()
-
-            # Act
-            updated = repository.update_video(sample_video.id, title="New Title")
+        # Act
+        updated = repository.update_video(sample_video.id, title="New Title")
 
-            # Assert
-            assert updated.title == "New Title"
-            # NO debe invalidar caché (solo title cambió, no status)
-            mock_cache.delete.assert_not_called()
+        # Assert
+        assert updated.title == "New Title"
+        # NO debe invalidar caché (solo title cambió, no status)
+        mock_cache.delete.assert_not_called()
 
     def test_update_video_not_found(self, repository):
         """Test 31: update_video() de video inexistente lanza ValueError"""
-        # Arrange
-        non_existent_id = uuid4()
-
         # Act & Assert
         with pytest.raises(NotFoundError):
-            repository.update_video(non_existent_id, title="New Title")
+            repository.update_video(_KNOWN_MISSING_ID, title="New Title")
 
 
 class TestVideoRepositorySkippedVideos:
     """Tests para get_skipped_videos()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
     def test_get_skipped_videos(self, repository, sample_source, db_session):
         """Test 32: Obtener videos skipped"""
         # Arrange - crear video skipped
@@ -472,7 +419,7 @@ class TestVideoRepositorySkippedVideos:
             status=VideoStatus.SKIPPED,
         )
         repository.create(video)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         skipped = repository.get_skipped_videos()
@@ -492,7 +439,7 @@ class TestVideoRepositorySkippedVideos:
             status=VideoStatus.SKIPPED,
         )
         repository.create(video)
-        db_session.commit()
+        db_session.flush()
 
         # Act
         skipped = repository.get_skipped_videos(source_id=sample_source.id)
@@ -505,10 +452,6 @@ class TestVideoRepositorySkippedVideos:
 class TestVideoRepositoryStats:
     """Tests para get_stats_by_status()."""
 
-    @pytest.fixture
-    def repository(self, db_session):
-        return VideoRepository(db_session)
-
     def test_get_stats_by_status(self, repository, multiple_videos):
         """Test 34: Estadísticas agrupadas por status"""
         # Act